@@ -36,11 +36,29 @@ class Config(BaseSettings):
     # Database Configuration
     MONGO_URI: str
     MONGO_DB: str
+    # The scraper only talks to MongoDB from its main thread, a small pool with a warm connection is enough
+    MONGO_MAX_POOL_SIZE: int = Field(default=10)
+    MONGO_MIN_POOL_SIZE: int = Field(default=1)
+    MONGO_SERVER_SELECTION_TIMEOUT_MS: int = Field(default=5000)
 
     # Scraping Configuration
     MAX_SCRAPING_WORKERS: int = Field(default=5)
+    # Processes for parsing article HTML, 0 parses in the scraping threads and None uses one per CPU.
+    # Every process imports the full package, which costs several hundred MB each.
+    MAX_EXTRACTION_WORKERS: Optional[int] = Field(default=0)
+    # Firefox instances for pages that need a browser, each one takes a few hundred MB once it is launched
+    MAX_BROWSER_WORKERS: int = Field(default=2)
+    # Hosts that timed out, failed to connect or returned server errors this many times in a row are skipped for
+    # HOST_FAILURE_COOLDOWN seconds, 0 never skips a host
+    HOST_FAILURE_THRESHOLD: int = Field(default=5)
+    HOST_FAILURE_COOLDOWN: float = Field(default=600)
     MIN_CONTENT_LENGTH: int = Field(default=300)
     MAX_CONTENT_LENGTH: int = Field(default=500000)
+    # Response bodies are cut off after this many bytes, the article text sits well within the first few MB
+    MAX_RESPONSE_BYTES: int = Field(default=2 * 1024 * 1024)
+    # Number of fetch results (pages and failures) kept in memory for articles that several feeds link to,
+    # 0 disables the cache
+    FETCH_CACHE_SIZE: int = Field(default=128)
 
     # HTTP Configuration
     USER_AGENTS: List[str] = Field(default=[
@@ -1,7 +1,8 @@
 # path: globe_news_scraper/data_providers/news_pipeline/__init__.py
 
-from typing import List, Dict, Optional, cast
-from concurrent.futures import ThreadPoolExecutor, as_completed
+from datetime import datetime, timezone
+from typing import List, Dict, Optional
+from concurrent.futures import ThreadPoolExecutor
 
 import structlog
 from pymongo.errors import BulkWriteError
@@ -23,6 +24,8 @@ class NewsPipeline:
         self._news_sources = NewsSourceFactory.get_all_sources(self._config)
         self._article_builder = ArticleBuilder(self._config, telemetry)
         self._db_handler = db_handler
+        # Earliest publication date of the articles inserted during a run, the daily summary is refreshed from it
+        self._earliest_published: Optional[datetime] = None
 
     def run_pipeline(self) -> List[str]:
         """
@@ -32,44 +35,69 @@ class NewsPipeline:
             List[str]: A list of Mongo ObjectIds for the inserted articles.
         """
         all_articles = []
-        # Iterate through all news sources and all countries supported by each source
-        for news_source in self._news_sources:
-            for country_code in news_source.available_countries:
-                try:
-                    articles = self._process_country(news_source, country_code)
-                    all_articles.extend(articles)
-                    self._logger.info(
-                        "Country processing complete",
-                        news_source=news_source.__class__.__name__,
-                        country_code=country_code,
-                        articles_count=len(articles)
-                    )
-                except Exception as e:
-                    self._logger.error(
-                        "Failed to process country",
-                        news_source=news_source.__class__.__name__,
-                        country_code=country_code,
-                        error=str(e)
-                    )
+        self._earliest_published = None
+        # One worker pool is shared by every country, so builder threads are started once per run
+        try:
+            with ThreadPoolExecutor(max_workers=self._config.MAX_SCRAPING_WORKERS,
+                                    thread_name_prefix='article-builder') as executor:
+                # Iterate through all news sources and all countries supported by each source
+                for news_source in self._news_sources:
+                    for country_code in news_source.available_countries:
+                        try:
+                            articles = self._process_country(news_source, country_code, executor)
+                            all_articles.extend(articles)
+                            self._logger.info(
+                                "Country processing complete",
+                                news_source=news_source.__class__.__name__,
+                                country_code=country_code,
+                                articles_count=len(articles)
+                            )
+                        except Exception as e:
+                            self._logger.error(
+                                "Failed to process country",
+                                news_source=news_source.__class__.__name__,
+                                country_code=country_code,
+                                error=str(e)
+                            )
+            if all_articles and self._earliest_published is not None:
+                self._db_handler.refresh_daily_summary(self._earliest_published)
+        finally:
+            self._article_builder.close()
         return all_articles
 
-    def _process_country(self, news_source: NewsSource, target_country: str) -> List[str]:
+    def _process_country(self, news_source: NewsSource, target_country: str,
+                         executor: ThreadPoolExecutor) -> List[str]:
         """
         Process a single country's trending news from a news source.
 
+        Args:
+            news_source (NewsSource): The news source to get the trending news from.
+            target_country (str): The country code to get the trending news for.
+            executor (ThreadPoolExecutor): The worker pool the articles are built on.
+
         Returns:
             List[str]: A list of Mongo ObjectIds for the inserted articles.
         """
         trending_news = news_source.get_country_trending_news(mkt=target_country)
 
-        with ThreadPoolExecutor(max_workers=self._config.MAX_SCRAPING_WORKERS) as executor:
-            future_to_item = {executor.submit(self._build_article, item): item for item in trending_news}
-            built_articles = cast(List[GlobeArticle], [
-                future.result() for future in as_completed(future_to_item)
-                if future.result() is not None
-            ])
+        # Look up every url of the country in one query instead of one round-trip per article
+        existing_urls = self._db_handler.get_existing_urls([news_item.url for news_item in trending_news])
+        new_items = []
+        for news_item in trending_news:
+            if news_item.url in existing_urls:
+                self._logger.debug(f"Article already exists in the database, skipping: {news_item.url}")
+            else:
+                new_items.append(news_item)
+
+        built_articles = [article for article in executor.map(self._build_article, new_items)
+                          if article is not None]
 
         inserted_articles = self._bulk_insert_articles(built_articles)
+        if inserted_articles:
+            earliest = min(article.date_published if article.date_published.tzinfo
+                           else article.date_published.replace(tzinfo=timezone.utc) for article in built_articles)
+            if self._earliest_published is None or earliest < self._earliest_published:
+                self._earliest_published = earliest
 
         self._log_country_processing_stats(target_country, trending_news, built_articles, inserted_articles)
 
@@ -77,18 +105,14 @@ class NewsPipeline:
 
     def _build_article(self, news_item: NewsSourceArticleData) -> Optional[GlobeArticle]:
         """
-        Build a GlobeArticle object from news item data if it doesn't already exist in the database.
+        Build a GlobeArticle object from news item data.
 
         Args:
             news_item (NewsSourceArticleData): A news item data object from a news source.
 
         Returns:
-            Optional[GlobeArticle]: A GlobeArticle object if successfully built, None if already in DB or otherwise.
+            Optional[GlobeArticle]: A GlobeArticle object if successfully built, None otherwise.
         """
-        if self._db_handler.does_article_exist(news_item.url):
-            self._logger.debug(f"Article already exists in the database, skipping: {news_item.url}")
-            return None
-
         try:
             return self._article_builder.build(news_item)
         except Exception as e:
@@ -1,15 +1,19 @@
 # path: globe_news_scraper/data_providers/news_pipeline/article_builder.py
 
-import datetime
-from typing import Optional, Dict, Any
-from xxlimited import Error
+import logging
+import multiprocessing
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from typing import Dict, Optional, Tuple
+from urllib.parse import urlsplit
 
 import structlog
-from pycountry import languages
-from pydantic import HttpUrl
 
 from globe_news_scraper.data_providers.news_sources.models import NewsSourceArticleData
 from globe_news_scraper.config import Config
+from globe_news_scraper.logger import is_enabled_for
 from globe_news_scraper.monitoring import GlobeScraperTelemetry
 from globe_news_scraper.models import GlobeArticle, ArticleData
 from globe_news_scraper.data_providers.news_pipeline.content_validator import ContentValidator
@@ -40,6 +44,15 @@ class ArticleBuilder:
         self._telemetry = telemetry
         self._web_content_fetcher = WebContentFetcher(config, self._telemetry.request_tracker)
         self._content_validator = ContentValidator(config)
+        self._max_extraction_workers = config.MAX_EXTRACTION_WORKERS
+        self._extraction_pool: Optional[ProcessPoolExecutor] = None
+        self._extraction_pool_lock = threading.Lock()
+        self._host_failure_threshold = config.HOST_FAILURE_THRESHOLD
+        self._host_failure_cooldown = config.HOST_FAILURE_COOLDOWN
+        # Consecutive fetch failures per host, and the time.monotonic() until which a failing host is skipped
+        self._host_failures: Dict[str, int] = {}
+        self._skipped_hosts: Dict[str, float] = {}
+        self._host_lock = threading.Lock()
 
     def build(self, news_item: NewsSourceArticleData) -> Optional[GlobeArticle]:
         """
@@ -48,11 +61,21 @@ class ArticleBuilder:
         :param news_item: A NewsSourceArticleData object containing metadata of a news article.
         :return: A GlobeArticle object if successfully built, None otherwise.
         """
+        # Skip hosts that failed repeatedly, their other articles are unlikely to load either
+        host = urlsplit(news_item.url).hostname or ''
+        if self._is_host_skipped(host):
+            self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
+            if is_enabled_for(logging.DEBUG):
+                self._logger.debug("Skipping article of a host that failed repeatedly", url=news_item.url, host=host)
+            return None
+
         # Fetch the raw article content from the news_item URL
-        raw_article = self._fetch_article_content(news_item.url)
+        status_code, raw_article = self._fetch_article_content(news_item.url)
+        self._record_fetch_result(host, status_code)
         if not raw_article:
             self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
-            self._logger.debug(f"No content to build GlobeArticle object with for {news_item.url}")
+            if is_enabled_for(logging.DEBUG):
+                self._logger.debug(f"No content to build GlobeArticle object with for {news_item.url}")
             return None
 
         # Build an ArticleData object from the raw article content
@@ -62,7 +85,7 @@ class ArticleBuilder:
             self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
             self._logger.warning("Failed to extract article data with Goose extractor", url=news_item.url)
             return None
-        except Error as e:
+        except Exception as e:
             self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
             self._logger.error(f"Unknown error occurred while extracting article data: {e}")
             return None
@@ -74,7 +97,8 @@ class ArticleBuilder:
         article_is_valid, issues = self._content_validator.validate(article_data.cleaned_text)
         if not article_is_valid:
             self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
-            self._logger.debug(f"Invalid content for {news_item.url}: {issues}")
+            if is_enabled_for(logging.DEBUG):
+                self._logger.debug(f"Invalid content for {news_item.url}: {issues}")
             return None
 
         # Create a GlobeArticle object from the ArticleData and the data provided by the news API
@@ -87,6 +111,57 @@ class ArticleBuilder:
             self._telemetry.article_counter.track_build_attempt(news_item.url, success=False)
             return None
 
+    def close(self) -> None:
+        """
+        Release the network resources and extraction processes held by the builder.
+        """
+        self._web_content_fetcher.close()
+        with self._extraction_pool_lock:
+            if self._extraction_pool is not None:
+                self._extraction_pool.shutdown()
+                self._extraction_pool = None
+
+    def _is_host_skipped(self, host: str) -> bool:
+        """
+        Check whether a host is currently skipped because it failed transiently too many times in a row.
+
+        :param host: The hostname of the article URL.
+        :return: True if articles of the host should not be fetched.
+        """
+        with self._host_lock:
+            skipped_until = self._skipped_hosts.get(host)
+            if skipped_until is None:
+                return False
+            if time.monotonic() < skipped_until:
+                return True
+            # The cooldown is over, give the host a fresh set of attempts
+            del self._skipped_hosts[host]
+            self._host_failures.pop(host, None)
+            return False
+
+    def _record_fetch_result(self, host: str, status_code: int) -> None:
+        """
+        Record the result of fetching an article, skipping the host once it reaches the failure threshold.
+
+        Only transient failures (failed connections, timeouts, rate limits and server errors) count towards the
+        threshold. A missing or non-HTML page is specific to the article, and shows that the host is responding.
+
+        :param host: The hostname of the article URL.
+        :param status_code: The status code of the last fetch attempt.
+        """
+        if self._host_failure_threshold <= 0:
+            return
+        with self._host_lock:
+            if not WebContentFetcher.is_transient_failure(status_code):
+                self._host_failures.pop(host, None)
+                return
+            failures = self._host_failures.get(host, 0) + 1
+            self._host_failures[host] = failures
+            if failures >= self._host_failure_threshold and host not in self._skipped_hosts:
+                self._skipped_hosts[host] = time.monotonic() + self._host_failure_cooldown
+                self._logger.info("Skipping host after repeated failures", host=host, failures=failures,
+                                  cooldown=self._host_failure_cooldown)
+
     def _create_globe_article(self, extracted_data: ArticleData,
                               news_source_data: NewsSourceArticleData) -> GlobeArticle:
         """
@@ -109,30 +184,59 @@ class ArticleBuilder:
                 authors=extracted_data.authors,
                 origin_country=news_source_data.origin_country,
                 image_url=news_source_data.image_url or extracted_data.top_image,
-                date_scraped=datetime.datetime.today(),
                 source_api=news_source_data.source_api,
                 language=news_source_data.language or extracted_data.meta_lang
             )
-            self._logger.debug(f"Successfully created GlobeArticle object for {news_source_data.url}")
+            if is_enabled_for(logging.DEBUG):
+                self._logger.debug(f"Successfully created GlobeArticle object for {news_source_data.url}")
             return built_globe_article
         except Exception as e:
             raise ArticleBuilderError(f"Failed to create GlobeArticle object for {news_source_data.url}: {e}")
 
-    def _fetch_article_content(self, url: str) -> Optional[str]:
+    def _fetch_article_content(self, url: str) -> Tuple[int, Optional[str]]:
         """
         Fetch the raw HTML content from the specified URL.
 
         :param url: The URL of the webpage to fetch.
-        :return: The raw HTML content as a string if successful, None if the fetch operation fails.
+        :return: The status code of the last fetch attempt, and the raw HTML content as a string if successful or
+                 None if the fetch operation fails.
         """
-        return self._web_content_fetcher.fetch_content(url)
+        return self._web_content_fetcher.fetch_content_with_status(url)
 
-    @staticmethod
-    def _extract_article_data(raw_html: str) -> ArticleData:
+    def _extract_article_data(self, raw_html: str) -> ArticleData:
         """
         Extract the main content of an article from its raw HTML using the Goose extractor.
 
+        Extraction is CPU-bound, so if extraction workers are configured it runs in a separate process,
+        letting the scraping threads parse several articles at once instead of taking turns on the GIL.
+
         :param raw_html: The raw HTML content of the article.
         :return: An ArticleData object containing the extracted content.
         """
-        return extract_article(raw_html=raw_html)
+        pool = self._get_extraction_pool()
+        if pool is None:
+            return extract_article(raw_html=raw_html)
+        try:
+            return pool.submit(extract_article, raw_html).result()
+        except BrokenProcessPool:
+            self._logger.warning("Extraction process pool broke, restarting it")
+            with self._extraction_pool_lock:
+                if self._extraction_pool is pool:
+                    self._extraction_pool = None
+            pool.shutdown(wait=False)
+            return extract_article(raw_html=raw_html)
+
+    def _get_extraction_pool(self) -> Optional[ProcessPoolExecutor]:
+        """
+        Get the extraction process pool, starting it on first use.
+
+        :return: The process pool, or None if extraction runs in the calling thread.
+        """
+        if self._max_extraction_workers == 0:
+            return None
+        with self._extraction_pool_lock:
+            if self._extraction_pool is None:
+                # Fresh interpreters rather than forks, the parent runs Playwright and the scraping threads
+                self._extraction_pool = ProcessPoolExecutor(max_workers=self._max_extraction_workers,
+                                                            mp_context=multiprocessing.get_context('spawn'))
+            return self._extraction_pool
@@ -1,14 +1,19 @@
 # path: globe_news_scraper/data_providers/article_extractor.py
 
+import threading
 from typing import Optional, cast
 
 from goose3 import Goose  # type: ignore[import-untyped]
-from bs4 import BeautifulSoup, Comment
+from lxml import etree, html as lxml_html  # type: ignore[import-untyped]
 from pycountry import languages
 from pydantic_extra_types.language_code import LanguageAlpha2
 
 from globe_news_scraper.models import ArticleData
 
+# Goose instances are reused per thread (and so per extraction process), building one loads its
+# configuration and opens an HTTP session that is never used for raw HTML extraction
+_thread_local = threading.local()
+
 
 def extract_article(raw_html: str) -> ArticleData:
     """
@@ -20,56 +25,62 @@ def extract_article(raw_html: str) -> ArticleData:
     :param raw_html: The raw HTML content of the article.
     :return: An ArticleData object containing the cleaned text, metadata language, keywords, authors, and top image.
     """
-    g = Goose()
-    goose_article = g.extract(raw_html=raw_html)
+    goose_article = _get_goose().extract(raw_html=raw_html)
 
     try:
         meta_lang = _parse_language_code(goose_article.meta_lang)
     except ValueError:
         meta_lang = None
 
-    article_data = ArticleData(
-        cleaned_text=goose_article.cleaned_text,
+    # If the Goose extractor doesn't find any cleaned text, use an alternative method. This is resolved
+    # before building the ArticleData, assigning to a pydantic model goes through its __setattr__ override.
+    cleaned_text = goose_article.cleaned_text or _alternate_content_extraction(raw_html)
+
+    return ArticleData(
+        cleaned_text=cleaned_text,
         meta_lang=meta_lang,
         meta_keywords=goose_article.meta_keywords,
         authors=goose_article.authors,
         top_image=goose_article.top_image.src if goose_article.top_image else None,
     )
 
-    # If the Goose extractor doesn't find any cleaned text, use an alternative method
-    if len(article_data.cleaned_text) == 0:
-        article_data.cleaned_text = _alternate_content_extraction(raw_html)
 
-    return article_data
+def _get_goose() -> Goose:
+    """
+    Get the Goose extractor of the calling thread, creating it on first use.
+
+    :return: A Goose extractor that never fetches images over the network.
+    """
+    goose = getattr(_thread_local, 'goose', None)
+    if goose is None:
+        goose = Goose({'enable_image_fetching': False, 'parser_class': 'lxml'})
+        _thread_local.goose = goose
+    return goose
 
 
 def _alternate_content_extraction(html_content: str) -> str:
     """
     An alternative method for extracting text content from HTML if Goose extraction fails.
 
-    This method uses BeautifulSoup to parse the HTML, remove comments, script, and style elements,
+    This method uses lxml to parse the HTML, remove comments, script, and style elements,
     and then extract and clean the remaining text.
 
     :param html_content: The HTML content to extract text from.
     :return: A cleaned string containing the extracted text.
     """
-    soup = BeautifulSoup(html_content, "lxml")
-
-    # Remove comments
-    for element in soup(text=lambda text: isinstance(text, Comment)):
-        element.extract()
-
-    # Remove script and style elements
-    for script_or_style in soup(["script", "style"]):
-        script_or_style.extract()
-
-    # Remove all tags, leaving only the text content
-    text_content = soup.get_text(separator=" ")
+    try:
+        tree = lxml_html.fromstring(html_content)
+    except ValueError:
+        # lxml refuses str input that carries an XML encoding declaration, parse the bytes instead
+        tree = lxml_html.fromstring(html_content.encode('utf-8'))
+    except etree.ParserError:
+        return ''
 
-    # Clean and strip the text
-    clean_text = ' '.join(text_content.split())
+    # Remove comments, script and style elements
+    etree.strip_elements(tree, etree.Comment, 'script', 'style', with_tail=False)
 
-    return clean_text
+    # Join all remaining text nodes, then clean and strip the text
+    return ' '.join(' '.join(tree.itertext()).split())
 
 
 def _parse_language_code(lang_code: str) -> Optional[LanguageAlpha2]:
@@ -0,0 +1,172 @@
+# path: globe_news_scraper/data_providers/news_pipeline/browser_worker.py
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from queue import LifoQueue
+from typing import Callable, Dict, Iterator, Optional, Tuple, TypeVar
+
+from playwright.sync_api import sync_playwright, Browser, BrowserContext, Playwright, Route
+
+T = TypeVar('T')
+
+# Only the DOM is extracted from a page, resources of these types are never downloaded
+_BLOCKED_RESOURCE_TYPES = frozenset({'image', 'media', 'font', 'stylesheet'})
+
+
+class BrowserWorker:
+    """
+    A long-lived Playwright browser running on its own thread.
+
+    Launching a browser takes seconds while opening a new context takes milliseconds, so the browser is launched
+    once on first use and every fetch gets a fresh, isolated context. Playwright's sync API objects may only be used
+    from the thread that created them, so all browser work is funneled through a single-thread executor and
+    callers on any thread simply wait for their result.
+    """
+
+    def __init__(self, timeout: int = 10000) -> None:
+        """
+        Initialize the BrowserWorker. The browser itself is launched lazily on the first fetch.
+
+        :param timeout: Navigation timeout in milliseconds.
+        """
+        self._timeout = timeout
+        self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix='playwright-browser')
+        self._playwright: Optional[Playwright] = None
+        self._browser: Optional[Browser] = None
+
+    def fetch(self, url: str, headers: Dict[str, str]) -> Tuple[int, str]:
+        """
+        Fetch the raw HTML content of a webpage in a new browser context.
+
+        :param url: The URL of the webpage to fetch.
+        :param headers: Extra HTTP headers to send with every request of the page.
+        :return: A tuple containing the HTTP status code and the raw HTML content.
+        :raises playwright.sync_api.Error: If the page could not be loaded.
+        """
+        return self.run(lambda context: self._fetch(context, url), headers)
+
+    def run(self, action: Callable[[BrowserContext], T], headers: Optional[Dict[str, str]] = None) -> T:
+        """
+        Run an action in a new browser context on the browser thread, the context is closed afterwards.
+
+        :param action: Callable receiving the new context, it must not keep references to Playwright objects.
+        :param headers: Extra HTTP headers to send with every request of the context.
+        :return: The return value of the action.
+        """
+        return self._executor.submit(self._run, action, headers).result()
+
+    def close(self) -> None:
+        """
+        Close the browser and stop Playwright and the browser thread.
+        """
+        try:
+            self._executor.submit(self._shutdown).result()
+        finally:
+            self._executor.shutdown()
+
+    def _get_browser(self) -> Browser:
+        """
+        Get the browser, launching it (again) if it is not running. Must run on the browser thread.
+
+        :return: A connected browser.
+        """
+        if self._browser is None or not self._browser.is_connected():
+            if self._playwright is None:
+                self._playwright = sync_playwright().start()
+            self._browser = self._playwright.firefox.launch()
+        return self._browser
+
+    def _run(self, action: Callable[[BrowserContext], T], headers: Optional[Dict[str, str]]) -> T:
+        context = self._get_browser().new_context(extra_http_headers=headers)
+        try:
+            return action(context)
+        finally:
+            context.close()
+
+    def _fetch(self, context: BrowserContext, url: str) -> Tuple[int, str]:
+        context.route('**/*', _block_static_resources)
+        page = context.new_page()
+        response = page.goto(url, timeout=self._timeout)
+        if response and response.status != 200:
+            return response.status, ''
+        return 200, page.content()
+
+    def _shutdown(self) -> None:
+        try:
+            if self._browser is not None:
+                self._browser.close()
+        finally:
+            self._browser = None
+            if self._playwright is not None:
+                self._playwright.stop()
+                self._playwright = None
+
+
+class BrowserPool:
+    """
+    A fixed number of BrowserWorkers shared by the scraping threads, so that up to `size` pages load in parallel.
+
+    Idle workers are handed out most recently used first, the browsers of the other workers are only launched
+    once fetches actually overlap.
+    """
+
+    def __init__(self, size: int, timeout: int = 10000) -> None:
+        """
+        Initialize the BrowserPool. No browser is launched until it is needed.
+
+        :param size: Maximum number of browsers running at the same time.
+        :param timeout: Navigation timeout in milliseconds.
+        """
+        self._workers = [BrowserWorker(timeout) for _ in range(max(1, size))]
+        self._idle_workers: LifoQueue[BrowserWorker] = LifoQueue()
+        for worker in reversed(self._workers):
+            self._idle_workers.put(worker)
+
+    def fetch(self, url: str, headers: Dict[str, str]) -> Tuple[int, str]:
+        """
+        Fetch the raw HTML content of a webpage on the next idle browser, see BrowserWorker.fetch.
+
+        :param url: The URL of the webpage to fetch.
+        :param headers: Extra HTTP headers to send with every request of the page.
+        :return: A tuple containing the HTTP status code and the raw HTML content.
+        """
+        with self._checkout() as worker:
+            return worker.fetch(url, headers)
+
+    def run(self, action: Callable[[BrowserContext], T], headers: Optional[Dict[str, str]] = None) -> T:
+        """
+        Run an action in a new browser context on the next idle browser, see BrowserWorker.run.
+
+        :param action: Callable receiving the new context, it must not keep references to Playwright objects.
+        :param headers: Extra HTTP headers to send with every request of the context.
+        :return: The return value of the action.
+        """
+        with self._checkout() as worker:
+            return worker.run(action, headers)
+
+    def close(self) -> None:
+        """
+        Close every browser of the pool.
+        """
+        for worker in self._workers:
+            worker.close()
+
+    @contextmanager
+    def _checkout(self) -> Iterator[BrowserWorker]:
+        worker = self._idle_workers.get()
+        try:
+            yield worker
+        finally:
+            self._idle_workers.put(worker)
+
+
+def _block_static_resources(route: Route) -> None:
+    """
+    Abort requests for resources that don't contribute to the page's HTML, let all others through.
+
+    :param route: The intercepted request route.
+    """
+    if route.request.resource_type in _BLOCKED_RESOURCE_TYPES:
+        route.abort()
+    else:
+        route.continue_()
@@ -3,12 +3,97 @@
 import html
 import re
 import unicodedata
-from typing import List, Tuple, cast
-
-from llm_guard.input_scanners import InvisibleText  # type: ignore[import-untyped]
+from html.parser import HTMLParser
+from typing import Dict, List, Optional, Tuple
 
 from globe_news_scraper.config import Config
 
+_REPEATED_NEWLINES_PATTERN = re.compile(r'\n{2,}')
+
+# Format, private use and unassigned characters don't render and are used to hide text
+_INVISIBLE_CATEGORIES = frozenset({'Cf', 'Co', 'Cn'})
+
+
+class _InvisibleCharacterTable(Dict[int, Optional[int]]):
+    """
+    A str.translate table that deletes invisible characters.
+
+    The Unicode category of a character is only looked up the first time the character is seen, after that
+    str.translate resolves it from the dict in C.
+    """
+
+    def __missing__(self, codepoint: int) -> Optional[int]:
+        mapped = None if unicodedata.category(chr(codepoint)) in _INVISIBLE_CATEGORIES else codepoint
+        self[codepoint] = mapped
+        return mapped
+
+
+_INVISIBLE_CHARACTER_TABLE = _InvisibleCharacterTable()
+
+
+class _HTMLTextExtractor(HTMLParser):
+    """
+    Collects the text of an HTML fragment, dropping tags, comments and everything inside script, style and
+    iframe elements. The tokenizer works in a single pass without backtracking.
+
+    Only elements that are closed again are dropped. goose's cleaned text is plain prose, where a tag name like
+    <script> can just be mentioned, so the text after an unterminated element is kept.
+    """
+
+    _SKIPPED_TAGS = frozenset({'script', 'style', 'iframe'})
+
+    def __init__(self) -> None:
+        super().__init__(convert_charrefs=True)
+        self._parts: List[str] = []
+        # Text of the skipped elements that are still open, innermost last
+        self._skipped: List[List[str]] = []
+
+    def handle_starttag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        if tag in self._SKIPPED_TAGS:
+            self._skipped.append([])
+
+    def handle_startendtag(self, tag: str, attrs: List[Tuple[str, Optional[str]]]) -> None:
+        pass
+
+    def handle_endtag(self, tag: str) -> None:
+        if tag in self._SKIPPED_TAGS and self._skipped:
+            self._skipped.pop()
+
+    def handle_data(self, data: str) -> None:
+        (self._skipped[-1] if self._skipped else self._parts).append(data)
+
+    def close(self) -> None:
+        super().close()
+        if not self._skipped:
+            return
+        # Put back the text of the unterminated elements. The parser holds back everything after an unterminated
+        # script or style start tag as unparsed input, that input is parsed again as a fragment of its own
+        for skipped in self._skipped:
+            self._parts.extend(skipped)
+        self._skipped = []
+        if self.rawdata:
+            self._parts.append(_strip_html(self.rawdata))
+            self.rawdata = ''
+
+    @property
+    def text(self) -> str:
+        return ''.join(self._parts)
+
+
+def _strip_html(content: str) -> str:
+    """
+    Remove HTML markup and the contents of script, style and iframe elements, unescaping character references.
+
+    :param content: The content to strip.
+    :return: The text of the content.
+    """
+    if '<' not in content and '&' not in content:
+        return content
+    extractor = _HTMLTextExtractor()
+    extractor.feed(content)
+    extractor.close()
+    return extractor.text
+
 
 class ContentValidator:
     """
@@ -26,15 +111,16 @@ class ContentValidator:
         """
         self._min_content_length = config.MIN_CONTENT_LENGTH
         self._max_content_length = config.MAX_CONTENT_LENGTH
-        self._blocked_patterns = [
-            r'<script.*?>.*?</script>',  # Match scripts
-            r'<iframe.*?>.*?</iframe>',  # Match iframes
-            r'(?<!\\)\'.*?(?<!\\)\'',  # Match single quotes
-            r'(?<!\\)".*?(?<!\\)"',  # Match double quotes
-            r'\$[a-zA-Z_][a-zA-Z0-9_]*',  # Match potential MongoDB operators
-        ]
-
-        self._invisible_text_sanitizer = InvisibleText()
+        # Compiled once per validator instead of being looked up in re's cache on every call. The patterns can
+        # overlap (a script contains quotes), so each one is searched separately to report every pattern that matches.
+        # Every pattern needs a literal marker character to match, the regex only runs if the marker is present
+        self._blocked_patterns = [(marker, re.compile(pattern, re.IGNORECASE | re.DOTALL)) for marker, pattern in [
+            ('<', r'<script.*?>.*?</script>'),  # Match scripts
+            ('<', r'<iframe.*?>.*?</iframe>'),  # Match iframes
+            ("'", r'(?<!\\)\'.*?(?<!\\)\''),  # Match single quotes
+            ('"', r'(?<!\\)".*?(?<!\\)"'),  # Match double quotes
+            ('$', r'\$[a-zA-Z_][a-zA-Z0-9_]*'),  # Match potential MongoDB operators
+        ]]
 
     def validate(self, content: str) -> Tuple[bool, List[str]]:
         """
@@ -48,14 +134,16 @@ class ContentValidator:
         """
         issues = []
 
-        if self._max_content_length < len(content):
+        # Lengths are in characters, len() of a str is read from the object without scanning it
+        content_length = len(content)
+        if self._max_content_length < content_length:
             issues.append(f"Content exceeds maximum length of {self._max_content_length} characters")
-        elif len(content) < self._min_content_length:
+        elif content_length < self._min_content_length:
             issues.append(f"Content does not meet minimum length of {self._min_content_length} characters")
 
-        for pattern in self._blocked_patterns:
-            if re.search(pattern, content, re.IGNORECASE | re.DOTALL):
-                issues.append(f"Content contains potentially unsafe pattern: {pattern}")
+        for marker, pattern in self._blocked_patterns:
+            if marker in content and pattern.search(content):
+                issues.append(f"Content contains potentially unsafe pattern: {pattern.pattern}")
 
         return len(issues) == 0, issues
 
@@ -68,16 +156,17 @@ class ContentValidator:
         :param content: The content to sanitize.
         :return: The sanitized content as a string.
         """
-        # Remove or escape potentially harmful content
-        for pattern in self._blocked_patterns:
-            content = re.sub(pattern, '', content, flags=re.IGNORECASE | re.DOTALL)
+        # Remove HTML tags together with scripts, styles and iframes
+        content = _strip_html(content)
 
-        # Remove HTML tags (as an additional precaution)
-        content = re.sub(r'<[^>]+>', '', content)
+        # Remove or escape potentially harmful content
+        for marker, pattern in self._blocked_patterns:
+            if marker in content:
+                content = pattern.sub('', content)
 
         # Normalize newlines
         content = content.replace('\r\n', '\n').replace('\r', '\n')
-        content = re.sub(r'\n{2,}', '\n', content)
+        content = _REPEATED_NEWLINES_PATTERN.sub('\n', content)
 
         # Escape quotes and other special characters
         content = html.escape(content, quote=True)
@@ -95,7 +184,10 @@ class ContentValidator:
         """
         Sanitize the content by removing invisible text.
 
-        :param content: The content to scan for gibberish.
+        :param content: The content to scan for invisible text.
         :return: The sanitized content as a string.
         """
-        return cast(str, self._invisible_text_sanitizer.scan(content)[0])
\ No newline at end of file
+        # All invisible characters are outside of ASCII
+        if content.isascii():
+            return content
+        return content.translate(_INVISIBLE_CHARACTER_TABLE)
\ No newline at end of file
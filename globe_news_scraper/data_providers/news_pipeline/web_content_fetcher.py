@@ -1,17 +1,41 @@
 # path: globe_news_scraper/data_providers/news_pipeline/web_content_fetcher.py
 
+import codecs
+import logging
+import re
+import threading
 import time
-from random import choice
-from typing import Optional, Dict, Callable, Tuple, cast
-from urllib.parse import urlparse
+from collections import OrderedDict
+from itertools import cycle
+from random import sample
+from typing import Optional, Dict, Callable, Iterator, Tuple, cast
+from urllib.parse import urlsplit, urlunsplit, parse_qsl, urlencode
 
 import requests
 import structlog
-from playwright.sync_api import sync_playwright, TimeoutError, Error as PlaywrightError
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+from playwright.sync_api import BrowserContext, TimeoutError, Error as PlaywrightError
 
 from globe_news_scraper.config import Config
+from globe_news_scraper.logger import is_enabled_for
+from globe_news_scraper.data_providers.news_pipeline.browser_worker import BrowserPool
 from globe_news_scraper.monitoring.request_tracker import RequestTracker
 
+_HEADER_CHARSET_PATTERN = re.compile(r'charset=["\']?([\w.:-]+)', re.IGNORECASE)
+_META_CHARSET_PATTERN = re.compile(rb'<meta[^>]+charset=["\']?([\w.:-]+)', re.IGNORECASE)
+# The charset <meta> tag has to appear within the first 1024 bytes of a document, leave some slack
+_META_CHARSET_SCAN_BYTES = 4096
+# Statuses that mean the page is gone or isn't an HTML document, no other fetch method changes that
+_PERMANENT_FAILURE_STATUSES = frozenset({404, 410, 415, 451})
+# Timeouts and rate limits, together with server errors and failed connections (reported as 500), say more about
+# the state of a host than about the page that was requested
+_TRANSIENT_FAILURE_STATUSES = frozenset({408, 429})
+# Statuses of pages that refuse the browser User-Agent but are often served to API clients such as Postman
+_POSTMAN_RETRY_STATUSES = frozenset({401, 403})
+# Query parameters that only track where a link was shared, they never change the page itself
+_TRACKING_PARAMS = frozenset({'gclid', 'fbclid', 'msclkid'})
+
 
 class WebContentFetcher:
     """
@@ -30,9 +54,44 @@ class WebContentFetcher:
         self._user_agents = config.USER_AGENTS
         self._postman_ua = config.POSTMAN_USER_AGENT
         self._headers = config.HEADERS
+        # One complete header set per User-Agent, handed out round-robin from a random starting order
+        self._header_variants: Iterator[Dict[str, str]] = cycle([
+            {**self._headers, 'User-Agent': user_agent}
+            for user_agent in sample(self._user_agents, len(self._user_agents))
+        ])
+        self._postman_headers = {**self._headers, 'User-Agent': self._postman_ua}
+        self._max_response_bytes = config.MAX_RESPONSE_BYTES
         self._request_tracker = request_tracker
+        self._cache_size = config.FETCH_CACHE_SIZE
+        self._cache: OrderedDict[str, Tuple[int, Optional[str]]] = OrderedDict()
+        self._cache_lock = threading.Lock()
+        self._session = self._create_session(config.MAX_SCRAPING_WORKERS)
+        self._browser_pool = BrowserPool(config.MAX_BROWSER_WORKERS)
         self._domain_fetchers: Dict[str, Callable[[str], Tuple[int, str]]] = self._initialize_domain_fetchers()
 
+    @staticmethod
+    def _create_session(max_connections_per_host: int) -> requests.Session:
+        """
+        Create a requests session that keeps connections to news sites alive between fetches.
+
+        Rate limits and transient server errors are retried up to twice with a short backoff on the same
+        connection before the fetcher moves on to its fallback methods. Retry-After is not honoured, a site
+        asking for minutes would otherwise stall a scraping thread.
+
+        :param max_connections_per_host: Connections kept alive per host, one per scraping thread is enough.
+        :return: A requests session with a pooled, retrying HTTP adapter mounted for http and https.
+        """
+        session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=64,
+            pool_maxsize=max_connections_per_host,
+            max_retries=Retry(total=2, backoff_factor=0.3, status_forcelist=[429, 500, 502, 503, 504],
+                              allowed_methods=['GET'], respect_retry_after_header=False, raise_on_status=False),
+        )
+        session.mount('http://', adapter)
+        session.mount('https://', adapter)
+        return session
+
     def _initialize_domain_fetchers(self) -> Dict[str, Callable[[str], Tuple[int, str]]]:
         """
         Initialize the dictionary of domain-specific fetchers.
@@ -43,55 +102,166 @@ class WebContentFetcher:
             "www.msn.com": self._fetch_msn_com,
         }
 
+    def _find_fetcher_domain(self, hostname: str) -> Optional[str]:
+        """
+        Find the domain a custom fetcher is registered for, trying the exact hostname first and then each parent
+        domain, so a fetcher registered for example.com also handles news.example.com.
+
+        :param hostname: The lowercase hostname of the URL, without port.
+        :return: The registered domain, or None if there is no custom fetcher for the hostname.
+        """
+        while hostname:
+            if hostname in self._domain_fetchers:
+                return hostname
+            _, _, hostname = hostname.partition('.')
+        return None
+
     def fetch_content(self, url: str) -> Optional[str]:
+        """
+        Fetch the content of a news webpage, see fetch_content_with_status.
+
+        :param url: The URL of the webpage to fetch.
+        :return: The content of the webpage if successful, None otherwise.
+        """
+        return self.fetch_content_with_status(url)[1]
+
+    def fetch_content_with_status(self, url: str) -> Tuple[int, Optional[str]]:
         """
         Fetch the content of a news webpage using various methods.
 
         This method first checks if there's a custom fetcher for the domain, then attempts to fetch the content
-        using requests, then with a Postman User-Agent, and finally with Playwright if the previous attempts fail.
+        using requests, then with a Postman User-Agent if the request was refused (401/403), and finally with
+        Playwright if the previous attempts fail.
+
+        Results are cached by their normalized URL, so the same article linked from several feeds is only fetched
+        once. Failures are cached as well, a page that couldn't be loaded isn't run through every fallback again.
 
         :param url: The URL of the webpage to fetch.
-        :return: The content of the webpage if successful, None otherwise.
+        :return: The status code of the last fetch attempt, and the content of the webpage if successful or None
+                 otherwise.
+        """
+        cache_key = _normalize_url(url)
+        cached = self._get_cached(cache_key)
+        if cached is not None:
+            if cached[1] is not None:
+                self._request_tracker.track_request('cached_request', 200)
+            elif is_enabled_for(logging.DEBUG):
+                self._logger.debug('Page failed to load before, skipping', url=url)
+            return cached
+
+        result = self._fetch_uncached(url)
+        self._put_cached(cache_key, result)
+        return result
+
+    def _get_cached(self, key: str) -> Optional[Tuple[int, Optional[str]]]:
         """
-        domain = urlparse(url).netloc
+        Look up a page in the cache, marking it as most recently used.
+
+        :param key: The normalized URL of the page.
+        :return: The status code and content (None if it failed to load) of the page, or None if it isn't cached.
+        """
+        with self._cache_lock:
+            if key not in self._cache:
+                return None
+            self._cache.move_to_end(key)
+            return self._cache[key]
+
+    def _put_cached(self, key: str, result: Tuple[int, Optional[str]]) -> None:
+        """
+        Add a page to the cache, evicting the least recently used page if the cache is full.
+
+        :param key: The normalized URL of the page.
+        :param result: The status code of the page, and its content or None if it failed to load.
+        """
+        if self._cache_size <= 0:
+            return
+        with self._cache_lock:
+            self._cache[key] = result
+            self._cache.move_to_end(key)
+            if len(self._cache) > self._cache_size:
+                self._cache.popitem(last=False)
+
+    def _fetch_uncached(self, url: str) -> Tuple[int, Optional[str]]:
+        """
+        Fetch the content of a news webpage, trying the custom, requests, Postman and Playwright methods in turn.
+
+        :param url: The URL of the webpage to fetch.
+        :return: The status code of the last fetch attempt, and the content of the webpage if successful or None
+                 otherwise.
+        """
+        domain = self._find_fetcher_domain(urlsplit(url).hostname or '')
 
         # Check if there is a custom fetcher for the domain
-        if domain in self._domain_fetchers:
+        if domain is not None:
             response_status, response_content = self._domain_fetchers[domain](url)
             if response_status == 200:
                 self._request_tracker.track_request(f'custom_{domain}_request', 200)
-                return response_content
+                return 200, response_content
             else:
                 self._request_tracker.track_request(f'custom_{domain}_request', response_status)
-                return None  # Other methods are unlikely to work if the custom one fails
+                return response_status, None  # Other methods are unlikely to work if the custom one fails
 
-        # Set a random User-Agent header to avoid being blocked
-        self._headers['User-Agent'] = choice(self._user_agents)
+        # Rotate the User-Agent header to avoid being blocked
+        headers = next(self._header_variants)
 
         # Attempt to fetch with requests
-        response_status, response_content = self._fetch_with_requests(url)
-        if response_status == 200:
-            self._request_tracker.track_request('basic_request', 200)
-            return cast(str, response_content)
-
-        # Attempt to fetch with Postman User-Agent
-        headers = self._headers.copy()
-        headers['User-Agent'] = self._postman_ua
         response_status, response_content = self._fetch_with_requests(url, headers=headers)
         if response_status == 200:
-            self._request_tracker.track_request('postman_request', 200)
-            return cast(str, response_content)
+            self._request_tracker.track_request('basic_request', 200)
+            return 200, cast(str, response_content)
+        if not self._should_try_fallbacks(response_status):
+            self._request_tracker.track_request('basic_request', response_status)
+            return response_status, None
+
+        # Attempt to fetch with Postman User-Agent if the browser User-Agent was refused
+        if response_status in _POSTMAN_RETRY_STATUSES:
+            response_status, response_content = self._fetch_with_requests(url, headers=self._postman_headers)
+            if response_status == 200:
+                self._request_tracker.track_request('postman_request', 200)
+                return 200, cast(str, response_content)
+            if not self._should_try_fallbacks(response_status):
+                self._request_tracker.track_request('postman_request', response_status)
+                return response_status, None
 
         # Attempt to fetch with Playwright
-        self._logger.debug(f'Failed to fetch {url} with "requests" library. Trying Playwright.')
-        response_status, response_content = self._fetch_with_playwright(url)
+        if is_enabled_for(logging.DEBUG):
+            self._logger.debug('Failed to fetch with "requests" library, trying Playwright', url=url,
+                               status_code=response_status)
+        response_status, response_content = self._fetch_with_playwright(url, headers=headers)
         if response_status == 200:
             self._request_tracker.track_request('playwright_request', 200)
-            return cast(str, response_content)
+            return 200, cast(str, response_content)
 
         self._request_tracker.track_request('all_methods_failed', response_status)
-        self._logger.debug(f'All methods failed to load page: {url}')
-        return None
+        if is_enabled_for(logging.DEBUG):
+            self._logger.debug('All methods failed to load page', url=url, status_code=response_status)
+        return response_status, None
+
+    @staticmethod
+    def _should_try_fallbacks(status_code: int) -> bool:
+        """
+        Check whether a failed fetch is worth retrying with the Postman User-Agent and Playwright.
+
+        Blocked (401, 403, 429), server error and exception responses can succeed with a different client,
+        while missing, removed or non-HTML pages won't exist for a browser either.
+
+        :param status_code: The status code of the failed fetch.
+        :return: True if the next fetch method should be tried, False otherwise.
+        """
+        return status_code not in _PERMANENT_FAILURE_STATUSES
+
+    @staticmethod
+    def is_transient_failure(status_code: int) -> bool:
+        """
+        Check whether a failed fetch points at a problem with the host rather than with the requested page.
+
+        Failed connections, timeouts, rate limits and server errors are transient, while missing, removed, refused
+        or non-HTML pages are specific to the page and say nothing about the host's other pages.
+
+        :param status_code: The status code of the failed fetch.
+        :return: True if the failure is transient, False otherwise.
+        """
+        return status_code >= 500 or status_code in _TRANSIENT_FAILURE_STATUSES
 
     def _fetch_with_requests(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
         """
@@ -102,39 +272,67 @@ class WebContentFetcher:
         :return: A tuple containing the HTTP status code and the raw HTML content.
         """
         try:
-            r = requests.get(url, headers=headers if headers else self._headers, timeout=10)
-
-            # If the encoding is not apparent, return an empty string and pass on to Playwright
-            if not r.apparent_encoding:
-                return 500, ''
-            r.encoding = r.apparent_encoding
-            return r.status_code, r.text
+            with self._session.get(url, headers=headers if headers else self._headers, timeout=10,
+                                   stream=True) as r:
+                # Anything that isn't a (X)HTML document can't be an article, skip downloading it
+                content_type = r.headers.get('Content-Type', '').lower()
+                if content_type and 'html' not in content_type and 'xml' not in content_type:
+                    return 415, ''
+                body = self._read_capped(r)
+
+            return r.status_code, body.decode(self._detect_encoding(content_type, body), errors='replace')
         except Exception as e:
-            self._logger.warning(f'Request failed for {url}: {str(e)}')
+            self._logger.warning('Request failed', url=url, error=str(e))
             return 500, ''
 
-    def _fetch_with_playwright(self, url: str) -> Tuple[int, str]:
+    @staticmethod
+    def _detect_encoding(content_type: str, body: bytes) -> str:
+        """
+        Determine the encoding of an HTML document from its Content-Type header or its charset <meta> tag.
+
+        :param content_type: The Content-Type header of the response.
+        :param body: The raw bytes of the document.
+        :return: The declared encoding if it is known to Python, UTF-8 otherwise.
+        """
+        declared = _HEADER_CHARSET_PATTERN.search(content_type)
+        if declared:
+            encoding = declared.group(1)
+        else:
+            meta = _META_CHARSET_PATTERN.search(body, 0, _META_CHARSET_SCAN_BYTES)
+            encoding = meta.group(1).decode('ascii') if meta else 'utf-8'
+        try:
+            return codecs.lookup(encoding).name
+        except LookupError:
+            return 'utf-8'
+
+    def _read_capped(self, response: requests.Response) -> bytes:
+        """
+        Read a streamed response body, stopping once it exceeds the configured maximum size.
+
+        :param response: A response opened with stream=True.
+        :return: The body, truncated to at most MAX_RESPONSE_BYTES bytes.
+        """
+        chunks = []
+        size = 0
+        for chunk in response.iter_content(chunk_size=64 * 1024):
+            chunks.append(chunk)
+            size += len(chunk)
+            if size >= self._max_response_bytes:
+                break
+        return b''.join(chunks)[:self._max_response_bytes]
+
+    def _fetch_with_playwright(self, url: str, headers: Optional[Dict[str, str]] = None) -> Tuple[int, str]:
         """
-        Fetch the raw HTML content of a webpage using Playwright.
+        Fetch the raw HTML content of a webpage using one of the long-lived Playwright browsers.
 
         :param url: The URL of the webpage to fetch.
+        :param headers: Optional custom headers to use for the request.
         :return: A tuple containing the HTTP status code and the raw HTML content.
         """
         try:
-            with sync_playwright() as p:
-                browser = p.firefox.launch()
-                page = browser.new_page(extra_http_headers=self._headers)
-                response = page.goto(url, timeout=10000)
-
-                if response and response.status != 200:
-                    browser.close()
-                    return response.status, ''
-                else:
-                    raw_html = page.content()
-                    browser.close()
-                    return 200, raw_html
+            return self._browser_pool.fetch(url, headers if headers else self._headers)
         except (PlaywrightError, Exception) as e:
-            self._logger.warning(f'Playwright error for {url}: {str(e)}')
+            self._logger.warning('Playwright error', url=url, error=str(e))
             return 500, ''
 
     def _fetch_msn_com(self, url: str) -> Tuple[int, str]:
@@ -147,87 +345,98 @@ class WebContentFetcher:
         :param url: The URL of the MSN article to fetch.
         :return: A tuple containing the HTTP status code and the full HTML content.
         """
-        with sync_playwright() as p:
-            browser = p.firefox.launch(headless=True)
-            context = browser.new_context(ignore_https_errors=False)
-            page = context.new_page()
-
-            try:
-                page.goto(url, timeout=10000)
-
-                # Define selectors to wait for
-                selectors = [
-                    "[id^='ViewsPageId-']",
-                    "msn-article-page",
-                    ".article-page",
-                    "cp-article-reader"
-                ]
-
-                # Wait for any of the selectors to be visible
-                for selector in selectors:
-                    try:
-                        page.wait_for_selector(selector, state="visible", timeout=10000)
-                        break
-                    except PlaywrightError:
-                        continue
-                else:
-                    self._logger.warning(f"MSN Fetcher - No selectors found within the timeout period for: {url}")
-
-                # Additional wait to allow dynamic content to load
-                time.sleep(5)
-
-                # Extract the content and full HTML
-                full_html_with_content = page.evaluate('''() => {
-                    function getOuterHTML(element) {
-                        return element ? element.outerHTML : null;
-                    }
-
-                    // Try multiple methods to find the article content
-                    const methods = [
-                        () => {
-                            const cpArticle = document.querySelector("cp-article");
-                            return cpArticle && cpArticle.shadowRoot ? 
-                                cpArticle.shadowRoot.querySelector(".article-body") : null;
-                        },
-                        () => document.querySelector(".article-body"),
-                        () => document.querySelector("article"),
-                        () => document.querySelector("[id^='ViewsPageId-']"),
-                        () => document.body  // Last resort
-                    ];
-
-                    let contentElement = null;
-                    for (const method of methods) {
-                        contentElement = method();
-                        if (contentElement) break;
-                    }
-
-                    if (!contentElement) {
-                        return document.documentElement.outerHTML;
-                    }
-
-                    // Extract the content
-                    const extractedContent = contentElement.innerHTML;
-
-                    // Insert the extracted content back into the document
-                    const articleBodyPlaceholder = document.querySelector('cp-article');
-                    if (articleBodyPlaceholder) {
-                        articleBodyPlaceholder.innerHTML = extractedContent;
-                    }
-
-                    // Return the full HTML including the extracted content
+        return self._browser_pool.run(lambda context: self._load_msn_article(context, url))
+
+    def _load_msn_article(self, context: BrowserContext, url: str) -> Tuple[int, str]:
+        """
+        Load an MSN article in the given browser context. Runs on the browser thread.
+
+        :param context: A new browser context, it is closed by the browser worker.
+        :param url: The URL of the MSN article to fetch.
+        :return: A tuple containing the HTTP status code and the full HTML content.
+        """
+        page = context.new_page()
+
+        try:
+            page.goto(url, timeout=10000)
+
+            # Define selectors to wait for
+            selectors = [
+                "[id^='ViewsPageId-']",
+                "msn-article-page",
+                ".article-page",
+                "cp-article-reader"
+            ]
+
+            # Wait for any of the selectors to be visible
+            for selector in selectors:
+                try:
+                    page.wait_for_selector(selector, state="visible", timeout=10000)
+                    break
+                except PlaywrightError:
+                    continue
+            else:
+                self._logger.warning("MSN Fetcher - No selectors found within the timeout period", url=url)
+
+            # Additional wait to allow dynamic content to load
+            time.sleep(5)
+
+            # Extract the content and full HTML
+            full_html_with_content = page.evaluate('''() => {
+                function getOuterHTML(element) {
+                    return element ? element.outerHTML : null;
+                }
+
+                // Try multiple methods to find the article content
+                const methods = [
+                    () => {
+                        const cpArticle = document.querySelector("cp-article");
+                        return cpArticle && cpArticle.shadowRoot ? 
+                            cpArticle.shadowRoot.querySelector(".article-body") : null;
+                    },
+                    () => document.querySelector(".article-body"),
+                    () => document.querySelector("article"),
+                    () => document.querySelector("[id^='ViewsPageId-']"),
+                    () => document.body  // Last resort
+                ];
+
+                let contentElement = null;
+                for (const method of methods) {
+                    contentElement = method();
+                    if (contentElement) break;
+                }
+
+                if (!contentElement) {
                     return document.documentElement.outerHTML;
-                }''')
-
-                return 200, full_html_with_content
-            except TimeoutError:
-                self._logger.warning(f"Failed to fetch article from MSN: Timeout exceeded for {url}")
-                return 408, ''
-            except Exception as e:
-                self._logger.warning(f"MSN - Failed to fetch article content for {url}: {str(e)}")
-                return 500, ''
-            finally:
-                context.close()
-                browser.close()
+                }
+
+                // Extract the content
+                const extractedContent = contentElement.innerHTML;
+
+                // Insert the extracted content back into the document
+                const articleBodyPlaceholder = document.querySelector('cp-article');
+                if (articleBodyPlaceholder) {
+                    articleBodyPlaceholder.innerHTML = extractedContent;
+                }
+
+                // Return the full HTML including the extracted content
+                return document.documentElement.outerHTML;
+            }''')
+
+            return 200, full_html_with_content
+        except TimeoutError:
+            self._logger.warning("Failed to fetch article from MSN: Timeout exceeded", url=url)
+            return 408, ''
+        except Exception as e:
+            self._logger.warning("MSN - Failed to fetch article content", url=url, error=str(e))
+            return 500, ''
+
+    def close(self) -> None:
+        """
+        Close the pooled connections and the browser held by the fetcher.
+        """
+        self._session.close()
+        self._browser_pool.close()
 
     @property
     def request_tracker(self) -> RequestTracker:
@@ -237,3 +446,21 @@ class WebContentFetcher:
         :return: The RequestTracker object.
         """
         return self._request_tracker
+
+
+def _normalize_url(url: str) -> str:
+    """
+    Normalize a URL for use as a cache key.
+
+    The scheme and host are lowercased, the fragment is dropped and tracking parameters (utm_*, gclid, ...)
+    are removed from the query.
+
+    :param url: The URL to normalize.
+    :return: The normalized URL.
+    """
+    parts = urlsplit(url)
+    query = parts.query
+    if query:
+        query = urlencode([(key, value) for key, value in parse_qsl(query, keep_blank_values=True)
+                           if not key.startswith('utm_') and key not in _TRACKING_PARAMS])
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path, query, ''))
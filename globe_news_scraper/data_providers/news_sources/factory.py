@@ -1,8 +1,6 @@
 # globe_news_scraper/news_sources/factory.py
 from typing import List, Type
 
-from typing import List, Type
-
 from globe_news_scraper.config import Config
 from globe_news_scraper.data_providers.news_sources.base import NewsSource
 from globe_news_scraper.data_providers.news_sources.bing_news import BingNewsSource
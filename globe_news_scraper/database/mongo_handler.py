@@ -1,8 +1,11 @@
 # path: globe_news_scraper/database/mongo_handler.py
+import atexit
+import threading
 from datetime import datetime, timezone
-from typing import List, Dict, Any, Tuple, Optional
+from typing import List, Dict, Any, Tuple, Optional, Set
 
 import structlog
+from pydantic import TypeAdapter
 from pymongo import MongoClient, IndexModel, ASCENDING, DESCENDING
 from pymongo.errors import BulkWriteError, PyMongoError, ExecutionTimeout, OperationFailure
 
@@ -14,6 +17,42 @@ class MongoHandlerError(Exception):
     """Custom exception for MongoHandler errors."""
 
 
+# MongoClient owns a connection pool and monitoring threads and is meant to be long-lived, so one client per
+# URI and pool settings is shared by every MongoHandler of the process and closed on exit
+_clients: Dict[Tuple[str, int, int, int], MongoClient] = {}
+_clients_lock = threading.Lock()
+
+# Dumps a whole batch of articles in one pass through pydantic-core instead of one model_dump() call per article
+_ARTICLES_ADAPTER = TypeAdapter(List[GlobeArticle])
+
+
+def _get_client(config: Config) -> MongoClient:
+    """
+    Get the process-wide MongoClient for the configured URI and pool settings, creating it on first use.
+
+    :param config: Configuration object containing MongoDB settings.
+    :return: The shared MongoClient.
+    """
+    key = (config.MONGO_URI, config.MONGO_MAX_POOL_SIZE, config.MONGO_MIN_POOL_SIZE,
+           config.MONGO_SERVER_SELECTION_TIMEOUT_MS)
+    with _clients_lock:
+        client = _clients.get(key)
+        if client is None:
+            client = _clients[key] = MongoClient(config.MONGO_URI,
+                                                 maxPoolSize=config.MONGO_MAX_POOL_SIZE,
+                                                 minPoolSize=config.MONGO_MIN_POOL_SIZE,
+                                                 serverSelectionTimeoutMS=config.MONGO_SERVER_SELECTION_TIMEOUT_MS)
+        return client
+
+
+@atexit.register
+def _close_clients() -> None:
+    with _clients_lock:
+        for client in _clients.values():
+            client.close()
+        _clients.clear()
+
+
 class MongoHandler:
     """
     A handler class for managing MongoDB operations related to GlobeArticle objects.
@@ -33,7 +72,7 @@ class MongoHandler:
         self._logger = structlog.get_logger()
         self._config = config
         try:
-            self._client = client or MongoClient(self._config.MONGO_URI)
+            self._client = client or _get_client(self._config)
             self._db = self._client[self._config.MONGO_DB]
             self._articles = self._db.articles
 
@@ -65,29 +104,45 @@ class MongoHandler:
                 IndexModel([("url", ASCENDING)], unique=True, name="url_1"),
                 IndexModel([("title", ASCENDING)], unique=True, name="title_1"),
                 IndexModel([("date_published", DESCENDING)], name="date_published_-1"),
+                # Covers the fields grouped on by the daily_article_summary_by_country aggregation
+                IndexModel([("date_published", ASCENDING), ("origin_country", ASCENDING)],
+                           name="date_published_1_origin_country_1"),
                 IndexModel([("category", ASCENDING)], name="category_1"),
                 IndexModel([("origin_country", ASCENDING)], name="origin_country_1"),
                 IndexModel([("post_processed", ASCENDING), ("date_scraped", DESCENDING)],
-                           name="post_processed_1_date_scraped_-1")
+                           name="post_processed_1_date_scraped_-1"),
+                # Backs the filtered_articles view, which only ever matches post-processed articles
+                IndexModel([("date_scraped", DESCENDING)], partialFilterExpression={"post_processed": True},
+                           name="post_processed_partial_idx")
             ]
 
-            # Create or update indexes
+            # Only send the indexes that are missing or whose definition changed, a re-run against an
+            # initialized database then doesn't issue any createIndexes command at all
+            existing = self._articles.index_information()
+            missing = []
             for index in indexes:
-                try:
-                    self._articles.create_index(index.document["key"], unique=index.document.get("unique", False),
-                                                name=index.document["name"])
-                except OperationFailure as e:
-                    if "already exists with different options" in str(e):
-                        self._logger.warning(f"Updating existing index: {index.document['name']}")
-                        self._articles.drop_index(index.document["name"])
-                        self._articles.create_index(index.document["key"], unique=index.document.get("unique", False),
-                                                    name=index.document["name"])
-                    else:
-                        raise
-
-            # Create the views
-            self._create_daily_summary_view()
-            self._create_filtered_articles_view()
+                name = index.document["name"]
+                if name in existing:
+                    if self._index_matches(index, existing[name]):
+                        continue
+                    self._logger.warning("Updating existing index", index=name)
+                    self._articles.drop_index(name)
+                missing.append(index)
+
+            if missing:
+                self._articles.create_indexes(missing)
+
+            # Create the views, or update their definition if they already exist
+            collections = {info["name"]: info["type"] for info in self._db.list_collections()}
+            self._create_filtered_articles_view(collections)
+
+            # The daily summary is a materialized collection, replace the view of earlier versions and backfill it
+            if collections.get("daily_article_summary_by_country") == "view":
+                self._db.drop_collection("daily_article_summary_by_country")
+            # The app reads the summaries newest first by date, as it did from the sorted view
+            self._db.daily_article_summary_by_country.create_index([("date", DESCENDING)], unique=True,
+                                                                    name="date_-1")
+            self._merge_daily_summary()
 
             # Create validation schema for the articles collection
             self._configure_schema_validation()
@@ -96,71 +151,121 @@ class MongoHandler:
         except PyMongoError as e:
             raise MongoHandlerError(f"Failed to initialize database: {str(e)}")
 
-    def _create_daily_summary_view(self) -> None:
+    @staticmethod
+    def _index_matches(index: IndexModel, info: Dict[str, Any]) -> bool:
+        """
+        Check whether an existing index has the same definition as the given IndexModel.
+
+        :param index: The wanted index.
+        :param info: The existing index as reported by index_information().
+        :return: True if the keys and options of both indexes match.
         """
-        Create the daily_article_summary_by_country view, used by The Globe app to preload artice urls.
+        document = index.document
+        return (list(document["key"].items()) == [tuple(key) for key in info["key"]]
+                and document.get("unique", False) == info.get("unique", False)
+                and document.get("partialFilterExpression") == info.get("partialFilterExpression"))
+
+    def _create_or_update_view(self, name: str, pipeline: List[Dict[str, Any]], collections: Dict[str, str]) -> None:
+        """
+        Create a view on the articles collection, or replace the pipeline of the view if it already exists.
+
+        :param name: The name of the view.
+        :param pipeline: The aggregation pipeline of the view.
+        :param collections: The types of the collections and views currently in the database, by name.
         """
         self._db.command({
-            'create': 'daily_article_summary_by_country',
+            'collMod' if name in collections else 'create': name,
             'viewOn': 'articles',
-            'pipeline': [
-                # Step 1: Project relevant fields for further processing
-                {
-                    '$project': {
-                        'date': {'$dateToString': {'format': "%Y-%m-%d", 'date': "$date_published"}},
-                        'origin_country': 1,  # Include the country of origin
-                        'url': 1  # Include the URL field
-                    }
-                },
-                # Step 2: Group articles by date and country of origin, and count the number of articles per group
-                {
-                    '$group': {
-                        '_id': {
-                            'date': '$date',  # Group by formatted date
-                            'origin_country': '$origin_country'  # Group by country of origin
-                        },
-                        'count': {'$sum': 1},  # Count the number of articles in each group
-                        'article_urls': {'$addToSet': '$url'}  # Collect the article urls in each group
-                    }
-                },
-                # Step 3: Group results by date, creating an array of countries with their article counts and URLs
-                {
-                    '$group': {
-                        '_id': '$_id.date',  # Group by date
-                        'countries': {
-                            '$push': {  # Create an array of countries with their counts and article urls
-                                'country': '$_id.origin_country',
-                                'count': '$count',
-                                'article_urls': '$article_urls'
-                            }
-                        },
-                        'total_count': {'$sum': '$count'}  # Calculate the total number of articles for the date
-                    }
-                },
-                # Step 4: Project the final structure of the view
-                {
-                    '$project': {
-                        '_id': 0,  # Exclude the MongoDB auto-generated ID
-                        'date': '$_id',  # Include the date
-                        'countries': 1,  # Include the array of countries with their article data
-                        'total_count': 1  # Include the total count of articles for the date
-                    }
-                },
-                # Step 5: Sort the results by date in descending order
-                {
-                    '$sort': {'date': -1}  # Sort by date (newest first)
-                }
-            ]
+            'pipeline': pipeline
         })
 
-    def _create_filtered_articles_view(self) -> None:
+    def refresh_daily_summary(self, since: Optional[datetime] = None) -> None:
+        """
+        Recompute the daily_article_summary_by_country collection, used by The Globe app to preload article urls.
+
+        :param since: Only recompute the days from this date on, all other days are left untouched.
+        """
+        try:
+            self._merge_daily_summary(since)
+        except PyMongoError as e:
+            self._logger.error(f"MongoDB error while refreshing the daily summary. Error: {str(e)}")
+
+    def _merge_daily_summary(self, since: Optional[datetime] = None) -> None:
+        """
+        Aggregate the articles into one summary document per day and merge them into the
+        daily_article_summary_by_country collection, replacing the summaries of the recomputed days.
+
+        :param since: Only recompute the days from this date on, or every day if None.
+        """
+        pipeline: List[Dict[str, Any]] = []
+        if since is not None:
+            # Naive datetimes are stored as UTC by pymongo
+            if since.tzinfo is None:
+                since = since.replace(tzinfo=timezone.utc)
+            day_start = since.astimezone(timezone.utc).replace(hour=0, minute=0, second=0, microsecond=0)
+            pipeline.append({'$match': {'date_published': {'$gte': day_start}}})
+
+        pipeline += [
+            # Step 1: Group articles by day and country of origin, and count the number of articles per group.
+            # The day is truncated to a native date in the group key itself, it is only formatted once per day below
+            {
+                '$group': {
+                    '_id': {
+                        'date': {'$dateTrunc': {'date': "$date_published", 'unit': "day"}},
+                        'origin_country': '$origin_country'  # Group by country of origin
+                    },
+                    'count': {'$sum': 1},  # Count the number of articles in each group
+                    'article_urls': {'$push': '$url'}  # Collect the article urls, unique by the url index
+                }
+            },
+            # Step 2: Group results by date, creating an array of countries with their article counts and URLs
+            {
+                '$group': {
+                    '_id': '$_id.date',  # Group by date
+                    'countries': {
+                        '$push': {  # Create an array of countries with their counts and article urls
+                            'country': '$_id.origin_country',
+                            'count': '$count',
+                            'article_urls': '$article_urls'
+                        }
+                    },
+                    'total_count': {'$sum': '$count'}  # Calculate the total number of articles for the date
+                }
+            },
+            # Step 3: Project the final structure, the formatted date is also the _id that the summaries are merged on
+            {
+                '$set': {
+                    '_id': {'$dateToString': {'format': "%Y-%m-%d", 'date': "$_id"}}
+                }
+            },
+            {
+                '$project': {
+                    'date': '$_id',  # Include the date
+                    'countries': 1,  # Include the array of countries with their article data
+                    'total_count': 1  # Include the total count of articles for the date
+                }
+            },
+            # Step 4: Replace the summary of every recomputed day
+            {
+                '$merge': {
+                    'into': 'daily_article_summary_by_country',
+                    'on': '_id',
+                    'whenMatched': 'replace',
+                    'whenNotMatched': 'insert'
+                }
+            }
+        ]
+        self._articles.aggregate(pipeline)
+
+    def _create_filtered_articles_view(self, collections: Dict[str, str]) -> None:
         """
         Create the filtered_articles view to display only post-processed articles with translated fields.
+
+        :param collections: The types of the collections and views currently in the database, by name.
         """
-        self._db.command({
-            "create": "filtered_articles",
-            "viewOn": "articles",
-            "pipeline": [
+        self._create_or_update_view(
+            "filtered_articles",
+            [
                 {"$match": {"post_processed": True}},
                 {"$project": {
                     "url": 1,
@@ -177,8 +282,9 @@ class MongoHandler:
                     "image_url": 1,
                     "_id": 0
                 }}
-            ]
-        })
+            ],
+            collections
+        )
 
     def _configure_schema_validation(self) -> None:
         """
@@ -308,7 +414,7 @@ class MongoHandler:
         :param articles: A list of GlobeArticle objects to insert.
         :return: A tuple containing the inserted IDs and any errors that occurred.
         """
-        serialized_articles = [self._serialize_article(article) for article in articles]
+        serialized_articles = self._serialize_articles(articles)
         errors: List[Dict[str, Any]] = []
         inserted_ids: List[Any] = []
 
@@ -317,7 +423,9 @@ class MongoHandler:
                 result = self._articles.insert_many(serialized_articles, ordered=False)
                 inserted_ids = result.inserted_ids
             except BulkWriteError as bwe:
+                failed_indexes = set()
                 for error in bwe.details.get('writeErrors', []):
+                    failed_indexes.add(error['index'])
                     self._logger.error("MongoDB Bulk write error occurred",
                                        article_url=serialized_articles[error['index']]['url'])
                     errors.append({
@@ -325,8 +433,10 @@ class MongoHandler:
                         'url': serialized_articles[error['index']]['url'],
                         'error': error['errmsg']
                     })
-                # Use insertedIds from BulkWriteError details if available
-                inserted_ids = bwe.details.get('insertedIds', [])
+                # The unordered insert kept going after the failed documents, and insert_many sets the _id of every
+                # document before sending it, so all documents that didn't fail were inserted
+                inserted_ids = [document['_id'] for index, document in enumerate(serialized_articles)
+                                if index not in failed_indexes]
             except ExecutionTimeout:
                 self._logger.error("Bulk write operation timed out", exc_info=True)
                 errors.append({'error': 'Operation timed out'})
@@ -361,20 +471,39 @@ class MongoHandler:
             self._logger.error(f"Unexpected error while checking article existence: {url}. Error: {str(e)}")
             return False
 
+    def get_existing_urls(self, urls: List[str]) -> Set[str]:
+        """
+        Get the URLs that already exist in the MongoDB collection, in a single query.
+
+        :param urls: The URLs of the articles to check.
+        :return: The subset of the given URLs that already exist.
+        """
+        if not urls:
+            return set()
+        try:
+            return {document["url"] for document in
+                    self._articles.find({"url": {"$in": urls}}, {"url": 1, "_id": 0})}
+        except PyMongoError as e:
+            self._logger.error(f"MongoDB error while checking article existence. Error: {str(e)}")
+            return set()
+        except Exception as e:
+            self._logger.error(f"Unexpected error while checking article existence. Error: {str(e)}")
+            return set()
+
     @staticmethod
-    def _serialize_article(article: GlobeArticle) -> Dict[str, Any]:
+    def _serialize_articles(articles: List[GlobeArticle]) -> List[Dict[str, Any]]:
         """
-        Serialize a GlobeArticle object to a dictionary for MongoDB insertion.
+        Serialize GlobeArticle objects to dictionaries for MongoDB insertion.
 
-        This method converts a GlobeArticle object to a dictionary and ensures that
+        This method converts the GlobeArticle objects to dictionaries and ensures that
         certain fields are properly formatted for storage in MongoDB.
 
-        :param article: The GlobeArticle object to serialize.
-        :return: A dictionary representing the serialized article.
+        :param articles: The GlobeArticle objects to serialize.
+        :return: A list of dictionaries representing the serialized articles.
         """
-        serialized_article = article.model_dump()
-        serialized_article.update({
-            'url': str(article.url),
-            'image_url': str(article.image_url) if article.image_url else None,
-        })
-        return serialized_article
+        # url and image_url are already plain strings (HttpUrl is only annotation metadata on a str field)
+        serialized_articles = _ARTICLES_ADAPTER.dump_python(articles)
+        for serialized_article in serialized_articles:
+            if not serialized_article['image_url']:
+                serialized_article['image_url'] = None
+        return serialized_articles
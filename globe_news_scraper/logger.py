@@ -1,14 +1,53 @@
 # path: globe_news_scraper/logger.py
 
+import io
 import os
 import re
 import logging
+import threading
 from logging import LogRecord
 from logging.handlers import RotatingFileHandler
-from typing import Literal
+from typing import Any, List, Literal, Optional, Tuple, cast
 
+import orjson
 import structlog
 
+_stack_info_renderer = structlog.processors.StackInfoRenderer()
+
+
+def _render_exception_info(logger: Any, method_name: str,
+                           event_dict: structlog.typing.EventDict) -> structlog.typing.EventDict:
+    """
+    Render stack and exception info, skipping both processors for the common record that carries neither.
+    """
+    if 'stack_info' in event_dict or 'exc_info' in event_dict:
+        event_dict = _stack_info_renderer(logger, method_name, event_dict)
+        event_dict = structlog.processors.format_exc_info(logger, method_name, event_dict)
+    return event_dict
+
+
+# Processors run for every record, level filtering is done up front by the bound logger.
+# TimeStamper renders UTC by default, which also avoids a local timezone lookup per record.
+_SHARED_PROCESSORS: list[structlog.typing.Processor] = [
+    structlog.stdlib.add_logger_name,
+    structlog.stdlib.add_log_level,
+    structlog.processors.TimeStamper(fmt="iso"),
+    _render_exception_info,
+    structlog.processors.UnicodeDecoder(),
+    structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
+]
+
+# goose3 logs this format string with the unresolved timestamp as its only argument
+_GOOSE_PUBLISH_DATE_MESSAGE = 'Publish date %s could not be resolved to UTC'
+_GOOSE_PUBLISH_DATE_PATTERN = re.compile(r'Publish date \d+ could not be resolved to UTC')
+
+# Bumped on every configure_logging call so that cached level checks know when to re-evaluate
+_logging_generation = 0
+
+# Arguments of the last configure_logging call and the handlers it added to the root logger
+_configured_args: Optional[Tuple[str, str, str]] = None
+_installed_handlers: List[logging.Handler] = []
+
 
 class GooseWarningFilter(logging.Filter):
     """
@@ -17,20 +56,159 @@ class GooseWarningFilter(logging.Filter):
     """
 
     def filter(self, record: LogRecord) -> bool:
-        return not re.match(r'Publish date \d+ could not be resolved to UTC', record.getMessage())
+        # Match the format string first, the message is only rendered for records that can still match
+        if record.msg == _GOOSE_PUBLISH_DATE_MESSAGE:
+            return False
+        if isinstance(record.msg, str) and not record.msg.startswith('Publish date '):
+            return True
+        return not _GOOSE_PUBLISH_DATE_PATTERN.match(record.getMessage())
+
 
-class LLMGuardWarningFilter(logging.Filter):
+class BufferedRotatingFileHandler(RotatingFileHandler):
     """
-    llm-guard logs a warning when it detects invisible text.
-    This filter removes that warning as GNS uses llm-guard to sanitize and remove that text.
+    A RotatingFileHandler that batches writes in a large user-space buffer instead of flushing after every record.
+
+    The buffer is written out on records at or above flush_level, before every rollover, on close and
+    periodically from a background thread, so low-severity records never stay in memory for longer than
+    flush_interval seconds.
     """
 
-    def filter(self, record: LogRecord) -> bool:
-        return not re.match(r'Found invisible characters in the prompt', record.getMessage())
+    def __init__(self, filename: str, maxBytes: int = 0, backupCount: int = 0, buffer_size: int = 64 * 1024,
+                 flush_level: int = logging.WARNING, flush_interval: float = 30.0) -> None:
+        """
+        Initialize the handler and start the periodic flush thread.
+
+        :param filename: Path of the log file.
+        :param maxBytes: Size in characters after which the file is rolled over, 0 disables rollover.
+        :param backupCount: Number of rolled over files to keep.
+        :param buffer_size: Size in bytes of the user-space write buffer.
+        :param flush_level: Records at or above this level are written out immediately.
+        :param flush_interval: Maximum number of seconds buffered records are held before being written out.
+        """
+        self._buffer_size = buffer_size
+        self._flush_level = flush_level
+        self._bytes_written = 0
+        self._is_regular_file = True
+        super().__init__(filename, maxBytes=maxBytes, backupCount=backupCount)
+
+        self._flush_stop = threading.Event()
+        self._flush_thread = threading.Thread(target=self._flush_periodically, args=(flush_interval,),
+                                              name='log-file-flusher', daemon=True)
+        self._flush_thread.start()
+
+    def _open(self) -> io.TextIOWrapper:
+        stream = cast(io.TextIOWrapper, open(self.baseFilename, self.mode, buffering=self._buffer_size,
+                                             encoding=self.encoding, errors=self.errors))
+        # Track the file size ourselves, the stock seek()/tell() rollover check flushes the buffer on every record
+        self._bytes_written = stream.buffer.tell()
+        self._is_regular_file = os.path.isfile(self.baseFilename)
+        return stream
+
+    def shouldRollover(self, record: LogRecord) -> bool:
+        if self.stream is None:
+            self.stream = self._open()
+        return self._should_rollover(len(self.format(record)) + len(self.terminator))
+
+    def _should_rollover(self, msg_size: int) -> bool:
+        """
+        Check whether writing a message of the given size would push the log file past maxBytes.
+
+        :param msg_size: Size in characters of the formatted message including the terminator.
+        :return: True if the file should be rolled over before writing the message.
+        """
+        # Never rollover anything other than regular files (see bpo-45401)
+        return self.maxBytes > 0 and self._is_regular_file and self._bytes_written + msg_size >= self.maxBytes
+
+    def doRollover(self) -> None:
+        self._flush_buffer()
+        super().doRollover()
+
+    def emit(self, record: LogRecord) -> None:
+        # Format the record once and reuse it for both the rollover check and the write
+        try:
+            msg = self.format(record) + self.terminator
+            if self.stream is None:
+                self.stream = self._open()
+            if self._should_rollover(len(msg)):
+                self.doRollover()
+                if self.stream is None:
+                    self.stream = self._open()
+            self.stream.write(msg)
+            self._bytes_written += len(msg)
+            if record.levelno >= self._flush_level:
+                self._flush_buffer()
+        except RecursionError:
+            raise
+        except Exception:
+            self.handleError(record)
+
+    def flush(self) -> None:
+        """
+        Intentionally a no-op, StreamHandler calls this after every record which would defeat the buffer.
+        """
+
+    def close(self) -> None:
+        self._flush_stop.set()
+        self._flush_buffer()
+        super().close()
+
+    def _flush_buffer(self) -> None:
+        """
+        Write the buffered records out to the log file.
+        """
+        super().flush()
+
+    def _flush_periodically(self, interval: float) -> None:
+        while not self._flush_stop.wait(interval):
+            self._flush_buffer()
+
+
+def _orjson_dumps(obj: Any, **kwargs: Any) -> str:
+    """
+    Serialize a log event with orjson, which returns bytes where the stdlib formatter expects a string.
+    """
+    return orjson.dumps(obj, option=orjson.OPT_NON_STR_KEYS, **kwargs).decode()
+
+
+def get_logging_generation() -> int:
+    """
+    Get the number of times logging has been configured, used to invalidate cached level checks.
+
+    :return: The current logging generation, 0 if configure_logging has not been called yet.
+    """
+    return _logging_generation
+
+
+def is_enabled_for(level: int) -> bool:
+    """
+    Check whether records of the given level pass the level set by configure_logging.
+
+    Until configure_logging is called structlog's defaults are in effect, which log every level.
+
+    :param level: The stdlib logging level to check.
+    :return: True if records of that level are logged, False otherwise.
+    """
+    return _logging_generation == 0 or logging.getLogger().isEnabledFor(level)
+
+
+def _add_filter_once(logger: logging.Logger, filter_class: type[logging.Filter]) -> None:
+    """
+    Add an instance of the filter class to the logger unless it already has one.
+
+    :param logger: The logger to add the filter to.
+    :param filter_class: The class of the filter to add.
+    """
+    if not any(isinstance(existing, filter_class) for existing in logger.filters):
+        logger.addFilter(filter_class())
 
 
 def configure_logging(log_level: str, logging_dir: str = 'logs',
                       environment: Literal['dev', 'prod', 'test'] = 'dev') -> None:
+    global _logging_generation, _configured_args
+    # Repeat calls with the same arguments keep the current setup
+    if _configured_args == (log_level, logging_dir, environment):
+        return
+
     logger_level = logging.INFO if environment == 'prod' else getattr(logging, log_level.upper(), logging.INFO)
 
     # Ignore DEBUG messages from specific loggers
@@ -38,41 +216,35 @@ def configure_logging(log_level: str, logging_dir: str = 'logs',
         logging.getLogger(logger_name).setLevel(logging.INFO)
 
     # Remove the warning about publish date not being resolved to UTC
-    logging.getLogger('goose3.crawler').addFilter(GooseWarningFilter())
-
-    # Remove the LLM Guard warning about invisible text
-    logging.getLogger('llm_guard.input_scanners').addFilter(LLMGuardWarningFilter())
+    _add_filter_once(logging.getLogger('goose3.crawler'), GooseWarningFilter)
 
     # Ensure the logging directory exists
     log_dir = os.path.dirname(f'{logging_dir}/globe_news_scraper.log')
-    os.makedirs(log_dir, exist_ok=True)
+    if not os.path.isdir(log_dir):
+        os.makedirs(log_dir, exist_ok=True)
 
     # Configure structlog
     structlog.configure(
-        processors=[
-            structlog.stdlib.filter_by_level,
-            structlog.stdlib.add_logger_name,
-            structlog.stdlib.add_log_level,
-            structlog.processors.TimeStamper(fmt="iso"),
-            structlog.processors.StackInfoRenderer(),
-            structlog.processors.format_exc_info,
-            structlog.processors.UnicodeDecoder(),
-            structlog.stdlib.ProcessorFormatter.wrap_for_formatter,
-        ],
+        processors=_SHARED_PROCESSORS,
         context_class=dict,
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,  # type: ignore[attr-defined]
+        # Calls below the configured level become no-ops before any event dict is built
+        wrapper_class=structlog.make_filtering_bound_logger(logger_level),
         cache_logger_on_first_use=True,
     )
 
     # Set up formatter
     formatter = structlog.stdlib.ProcessorFormatter(
-        processor=structlog.dev.ConsoleRenderer() if environment == 'dev' else structlog.processors.JSONRenderer(),
+        processor=structlog.dev.ConsoleRenderer() if environment == 'dev'
+        else structlog.processors.JSONRenderer(serializer=_orjson_dumps),
     )
 
-    # Add handler to the root logger
+    # Add handler to the root logger, replacing the ones added by a previous call
     root_logger = logging.getLogger()
     root_logger.setLevel(logger_level)
+    for handler in _installed_handlers:
+        root_logger.removeHandler(handler)
+        handler.close()
 
     # Add StreamHandler
     stream_handler = logging.StreamHandler()
@@ -80,10 +252,14 @@ def configure_logging(log_level: str, logging_dir: str = 'logs',
     root_logger.addHandler(stream_handler)
 
     # Add FileHandler
-    file_handler = RotatingFileHandler(
+    file_handler = BufferedRotatingFileHandler(
         f'{logging_dir}/globe_news_scraper.log',
         maxBytes=10 * 1024 * 1024,  # 10MB
         backupCount=5
     )
     file_handler.setFormatter(formatter)
     root_logger.addHandler(file_handler)
+
+    _installed_handlers[:] = [stream_handler, file_handler]
+    _configured_args = (log_level, logging_dir, environment)
+    _logging_generation += 1
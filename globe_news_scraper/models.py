@@ -1,15 +1,31 @@
 # path: globe_news_scraper/models.py
 
-from pydantic import BaseModel, HttpUrl, Field
+from pydantic import BaseModel, ConfigDict, HttpUrl, Field
 from pydantic_extra_types.country import CountryAlpha2
 from pydantic_extra_types.language_code import LanguageAlpha2
-from typing import Optional, List, Any, Annotated
+import time
+from typing import Optional, List, Annotated, Tuple
 from datetime import datetime
 
-from goose3 import Article  # type: ignore[import-untyped]
-
 from globe_news_scraper.version import CURRENT_SCHEMA_VERSION
 
+# Scraping timestamps only need coarse resolution, so datetime.now() is refreshed at most every 100 ms
+_NOW_CACHE_RESOLUTION = 0.1
+_now_cache: Tuple[float, datetime] = (0.0, datetime.now())
+
+
+def _now_cached() -> datetime:
+    """
+    Return the current local time, cached for up to _NOW_CACHE_RESOLUTION seconds.
+
+    :return: A datetime at most _NOW_CACHE_RESOLUTION seconds old.
+    """
+    global _now_cache
+    now = time.monotonic()
+    if now - _now_cache[0] > _NOW_CACHE_RESOLUTION:
+        _now_cache = (now, datetime.now())
+    return _now_cache[1]
+
 
 class GlobeArticle(BaseModel):
     """
@@ -37,6 +53,7 @@ class GlobeArticle(BaseModel):
         image_url (Optional[Annotated[str, HttpUrl]): The URL of the main image associated with the article.
         post_processed (bool): (irrelevant to this module) Will be true once the article is curated by globe_news_locator.
     """
+    model_config = ConfigDict(frozen=True, extra='ignore')
 
     title: str
     title_translated: Optional[str] = None
@@ -51,7 +68,7 @@ class GlobeArticle(BaseModel):
     keywords: List[str] = Field(default_factory=list)
     source_api: str
     schema_version: str = Field(default=CURRENT_SCHEMA_VERSION)
-    date_scraped: datetime = Field(default_factory=datetime.now)
+    date_scraped: datetime = Field(default_factory=_now_cached)
     category: Optional[str] = None
     authors: Optional[List[str]] = None
     related_countries: Optional[List[CountryAlpha2]] = None
@@ -1,10 +1,28 @@
+import logging
 import structlog
-from typing import Dict
-from collections import defaultdict
+from typing import Any, Dict
+from collections import Counter
 
+from globe_news_scraper.logger import get_logging_generation, is_enabled_for
 from globe_news_scraper.monitoring.request_tracker import RequestTracker
 from globe_news_scraper.monitoring.article_counter import ArticleCounter
 
+# Only the busiest request methods are broken down by status code, custom per-domain fetchers can add many more
+_MAX_REPORTED_METHODS = 50
+
+
+def _format_share(count: int, total: int) -> str:
+    """
+    Format a count as a percentage of the total, collapsing shares below one percent.
+
+    :param count: The count to format.
+    :param total: The total the count is a share of.
+    :return: The share as a percentage string, or "<1%" for shares below one percent.
+    """
+    if count * 100 < total:
+        return "<1%"
+    return f"{count / total:.2%}"
+
 
 class GlobeScraperTelemetry:
     """
@@ -21,6 +39,8 @@ class GlobeScraperTelemetry:
         self._logger = structlog.get_logger()
         self._request_tracker = RequestTracker()
         self._article_counter = ArticleCounter()
+        self._logging_generation = -1
+        self._info_enabled = True
 
     @property
     def request_tracker(self) -> RequestTracker:
@@ -40,51 +60,76 @@ class GlobeScraperTelemetry:
         """
         return self._article_counter
 
+    def _is_info_enabled(self) -> bool:
+        """
+        Check whether INFO records are logged, re-evaluating the level only after logging has been reconfigured.
+
+        :return: True if INFO records are logged, False otherwise.
+        """
+        generation = get_logging_generation()
+        if generation != self._logging_generation:
+            self._logging_generation = generation
+            self._info_enabled = is_enabled_for(logging.INFO)
+        return self._info_enabled
+
     def log_request_summary(self) -> None:
         """
         Log a summary of all web requests tracked, including success and failure counts, and success rates.
+        All methods are reported in a single log event.
         """
-        for method, stats in self._request_tracker.get_all_requests().items():
+        if not self._is_info_enabled():
+            return
+        methods: Dict[str, Dict[str, Any]] = {}
+        for method in self._request_tracker.get_all_requests():
+            success_count, failure_count = self._request_tracker.get_request_counts(method)
             success_rate = self._request_tracker.get_success_rate(method)
-            self._logger.info(f"{method} request stats",
-                              success_count=stats[200],
-                              failure_count=sum(count for status_code, count in stats.items() if status_code != 200),
-                              success_rate=f"{success_rate:.2%}")
+            methods[method] = {
+                "success_count": success_count,
+                "failure_count": failure_count,
+                "success_rate": f"{success_rate:.2%}",
+            }
+        self._logger.info("Request summary", methods=methods)
 
     def log_all_request_status_codes(self) -> None:
         """
         Log a detailed breakdown of HTTP status codes for all methods, as well as overall status code distribution.
+        The breakdown and the overall distribution are reported in a single log event.
         """
+        if not self._is_info_enabled():
+            return
         all_request_stats = self._request_tracker.get_all_requests()
-        self._logger.info("Detailed status code breakdown for all methods: ")
-        for method, stats in all_request_stats.items():
-            total_requests = sum(stats.values())
-            status_code_percentages = {
-                str(status_code): f"{count / total_requests:.2%}"
-                for status_code, count in stats.items()
+        method_totals = sorted(((stats.total(), method) for method, stats in all_request_stats.items()),
+                               key=lambda method_total: -method_total[0])
+        methods: Dict[str, Dict[str, Any]] = {}
+        for total_requests, method in method_totals[:_MAX_REPORTED_METHODS]:
+            methods[method] = {
+                "total_requests": total_requests,
+                "status_codes": {
+                    str(status_code): _format_share(count, total_requests)
+                    for status_code, count in all_request_stats[method].items()
+                },
             }
-            self._logger.info(f"{method} status code breakdown",
-                              total_requests=total_requests,
-                              **status_code_percentages)
 
-        # Log overall status code distribution
-        all_stats: Dict[int, int] = defaultdict(int)
+        # Overall status code distribution
+        all_stats: Counter[int] = Counter()
         for stats in all_request_stats.values():
-            for status_code, count in stats.items():
-                all_stats[status_code] += count
-        total_overall = sum(all_stats.values())
-        overall_percentages = {
-            str(status_code): f"{count / total_overall:.2%}"
-            for status_code, count in all_stats.items()
+            all_stats.update(stats)
+        total_overall = all_stats.total()
+        overall = {
+            "total_requests": total_overall,
+            "status_codes": {
+                str(status_code): _format_share(count, total_overall)
+                for status_code, count in all_stats.items()
+            },
         }
-        self._logger.info("Overall status code distribution",
-                          total_requests=total_overall,
-                          **overall_percentages)
+        self._logger.info("Request status code report", methods=methods, overall=overall)
 
     def log_article_stats(self) -> None:
         """
         Log statistics about the articles scraped, including total attempted articles and stats per provider.
         """
+        if not self._is_info_enabled():
+            return
         total_articles = self._article_counter.get_total_attempted_articles()
         provider_stats = self._article_counter.get_all_provider_stats()
         self._logger.info("Article scraping stats",
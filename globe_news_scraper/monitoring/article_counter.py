@@ -1,6 +1,10 @@
-from typing import Dict
-from urllib.parse import urlparse
-from collections import defaultdict
+import threading
+from typing import Dict, Set
+from urllib.parse import urlsplit
+from collections import Counter
+
+# Providers seen after the cap is reached are counted under this key
+OTHER_PROVIDERS = "__other__"
 
 
 class ArticleCounter:
@@ -8,12 +12,20 @@ class ArticleCounter:
     A class to track the number of articles scraped from each provider and the total number of articles scraped.
     """
 
-    def __init__(self) -> None:
+    def __init__(self, max_providers: int = 10_000) -> None:
         """
         Initialize the ArticleCounter with counters for total attempted articles and per-provider statistics.
+
+        :param max_providers: Maximum number of providers tracked individually, any further providers
+                              are counted together under OTHER_PROVIDERS.
         """
+        # Build attempts are tracked from the scraping threads
+        self._lock = threading.Lock()
         self._total_attempted_articles = 0
-        self._article_providers: Dict[str, Dict[str, int]] = defaultdict(lambda: {"failed": 0, "successful": 0})
+        self._max_providers = max_providers
+        self._providers: Set[str] = set()
+        self._successful_articles: Counter[str] = Counter()
+        self._failed_articles: Counter[str] = Counter()
 
     def track_build_attempt(self, url: str, success: bool) -> None:
         """
@@ -22,11 +34,18 @@ class ArticleCounter:
         :param url: The URL of the article that was attempted to be scraped.
         :param success: A boolean indicating whether the scraping attempt was successful.
         """
-        self._total_attempted_articles += 1
-
-        provider = urlparse(str(url)).netloc
-        status = "successful" if success else "failed"
-        self._article_providers[provider][status] += 1
+        provider = urlsplit(str(url)).netloc
+        with self._lock:
+            self._total_attempted_articles += 1
+            if provider not in self._providers:
+                if len(self._providers) < self._max_providers:
+                    self._providers.add(provider)
+                else:
+                    provider = OTHER_PROVIDERS
+            if success:
+                self._successful_articles[provider] += 1
+            else:
+                self._failed_articles[provider] += 1
 
     def get_total_attempted_articles(self) -> int:
         """
@@ -45,4 +64,8 @@ class ArticleCounter:
                  with counts of successful and failed scraping attempts.
         :rtype: Dict[str, Dict[str, int]]
         """
-        return self._article_providers
+        with self._lock:
+            return {
+                provider: {"failed": self._failed_articles[provider], "successful": self._successful_articles[provider]}
+                for provider in self._successful_articles | self._failed_articles
+            }
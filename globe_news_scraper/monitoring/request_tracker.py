@@ -1,6 +1,7 @@
 # path: globe_news_scraper/monitoring/request_tracker.py
 
-from collections import defaultdict
+import threading
+from collections import Counter, defaultdict
 from typing import Dict, Tuple
 
 
@@ -12,9 +13,16 @@ class RequestTracker:
 
     def __init__(self) -> None:
         """
-        Initialize the RequestTracker with a dictionary to track requests by method and status code.
+        Initialize the RequestTracker with counters to track requests by method and status code,
+        and the number of successful and failed requests per method.
+        Requests are tracked from the scraping threads, so updates are guarded by a lock.
         """
-        self._requests: Dict[str, Dict[int, int]] = defaultdict(lambda: {})
+        self._lock = threading.Lock()
+        self._requests: Dict[str, Counter[int]] = defaultdict(Counter)
+        self._successful: Counter[str] = Counter()
+        self._failed: Counter[str] = Counter()
+        self._total_successful = 0
+        self._total_failed = 0
 
     def track_request(self, method: str, status_code: int) -> None:
         """
@@ -23,20 +31,36 @@ class RequestTracker:
         :param method: The HTTP method used for the request (e.g., 'GET', 'POST').
         :param status_code: The HTTP status code returned from the request.
         """
-        if status_code in self._requests[method].keys():
+        with self._lock:
             self._requests[method][status_code] += 1
-        else:
-            self._requests[method][status_code] = 1
+            if status_code == 200:
+                self._successful[method] += 1
+                self._total_successful += 1
+            else:
+                self._failed[method] += 1
+                self._total_failed += 1
 
-    def get_all_requests(self) -> Dict[str, Dict[int, int]]:
+    def get_all_requests(self) -> Dict[str, Counter[int]]:
         """
-        Retrieve all tracked requests with their respective status codes.
+        Retrieve a snapshot of all tracked requests with their respective status codes.
 
         :return: A dictionary where the keys are HTTP methods and the values are dictionaries
                  of status codes and their corresponding counts.
-        :rtype: Dict[str, Dict[int, int]].
+        :rtype: Dict[str, Counter[int]].
         """
-        return self._requests
+        with self._lock:
+            return {method: stats.copy() for method, stats in self._requests.items()}
+
+    def get_request_counts(self, method: str) -> Tuple[int, int]:
+        """
+        Get the number of successful and failed requests for a given HTTP method.
+
+        :param method: The HTTP method to get the request counts for.
+        :return: A tuple containing the number of successful requests (status code 200)
+                 and the number of failed requests (any status code other than 200).
+        :rtype: Tuple[int, int]
+        """
+        return self._successful[method], self._failed[method]
 
     def get_success_rate(self, method: str) -> float:
         """
@@ -46,12 +70,9 @@ class RequestTracker:
         :return: The success rate as a float, where 1.0 represents 100% success.
         :rtype: float
         """
-        method_stats = self._requests[method]
-        total = sum(count for count in method_stats.values())
-        if 200 in method_stats:
-            return method_stats[200] / total if total > 0 else 0.0
-        else:
-            return 0.0
+        successful, failed = self.get_request_counts(method)
+        total = successful + failed
+        return successful / total if total > 0 else 0.0
 
     def get_all_success_rates(self) -> Dict[str, float]:
         """
@@ -60,7 +81,7 @@ class RequestTracker:
         :return: A dictionary where the keys are HTTP methods and the values are their success rates as floats.
         :rtype: Dict[str, float]
         """
-        return {method: self.get_success_rate(method) for method in self._requests}
+        return {method: self.get_success_rate(method) for method in self.get_all_requests()}
 
     def get_total_requests(self) -> Tuple[int, int]:
         """
@@ -70,8 +91,4 @@ class RequestTracker:
                  and the total number of failed requests (any status code other than 200).
         :rtype: Tuple[int, int]
         """
-        total_success = sum(stats[200] for stats in self._requests.values())
-        total_failure = sum(
-            sum(count for status_code, count in stats.items() if status_code != 200) for stats in
-            self._requests.values())
-        return total_success, total_failure
+        return self._total_successful, self._total_failed
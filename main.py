@@ -1,5 +1,6 @@
 import argparse
-import time
+import signal
+import threading
 from datetime import datetime
 
 import structlog
@@ -9,6 +10,27 @@ from globe_news_scraper import GlobeNewsScraper
 from globe_news_scraper.config import get_config
 from globe_news_scraper.logger import configure_logging
 
+# Set on SIGTERM so that a scheduled wait ends immediately instead of at the next run
+shutdown_event = threading.Event()
+
+
+def handle_sigterm(signum, frame):
+    shutdown_event.set()
+
+
+def wait_until(next_run):
+    """
+    Sleep until the given time without waking up in between.
+
+    :param next_run: The local time to wait for.
+    :return: True if the time was reached, False if a shutdown was requested first.
+    """
+    # Re-check after waking up, the wait is monotonic while next_run is wall-clock time
+    while (remaining := (next_run - datetime.now()).total_seconds()) > 0:
+        if shutdown_event.wait(remaining):
+            return False
+    return not shutdown_event.is_set()
+
 
 def scrape_news(config):
     logger = structlog.get_logger()
@@ -71,14 +93,16 @@ def main():
     # Set up the cron iterator
     if cron_schedule:
         cron = croniter(cron_schedule, datetime.now())
+        signal.signal(signal.SIGTERM, handle_sigterm)
 
         # Main loop
         while True:
             next_run = cron.get_next(datetime)
             logger.info(f"Next run scheduled for: {next_run}")
 
-            while datetime.now() < next_run:
-                time.sleep(60)
+            if not wait_until(next_run):
+                logger.info("Shutdown requested, stopping GlobeNewsScraper")
+                break
 
             logger.info("Starting scheduled scrape")
             scrape_news(config)
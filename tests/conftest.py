@@ -8,7 +8,7 @@ from globe_news_scraper.config import Config
 from globe_news_scraper.monitoring import GlobeScraperTelemetry
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_config():
     return Config(
         ENV='test',
@@ -20,6 +20,7 @@ def mock_config():
         MONGO_URI='mongodb://localhost:27017',
         MONGO_DB='test_db',
         MAX_SCRAPING_WORKERS=2,
+        MAX_EXTRACTION_WORKERS=0,
         MIN_CONTENT_LENGTH=100,
         MAX_CONTENT_LENGTH=10000,
         USER_AGENTS=['RandomUserAgent'],
@@ -52,7 +53,7 @@ def capturing_logger_factory():
     return structlog.testing.CapturingLoggerFactory()
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_news_article_html():
     return """
     <!DOCTYPE html>
@@ -81,7 +82,7 @@ def sample_news_article_html():
     """
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_short_article_html():
     return """
     <html lang="en">
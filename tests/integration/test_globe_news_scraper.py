@@ -5,7 +5,9 @@ from pydantic_extra_types.country import CountryAlpha2
 from pydantic_extra_types.language_code import LanguageAlpha2
 
 from globe_news_scraper import GlobeNewsScraper
+from globe_news_scraper.data_providers.news_sources.base import NewsSource
 from globe_news_scraper.data_providers.news_sources.models import NewsSourceArticleData
+from globe_news_scraper.database import MongoHandler
 
 
 @pytest.fixture
@@ -26,7 +28,7 @@ def mock_news_source(mocker, request):
             )
         ]
     )
-    mock_source = mocker.Mock()
+    mock_source = mocker.Mock(spec=NewsSource)
     mock_source.get_country_trending_news.return_value = articles
     mock_source.available_countries = ["en-GB"]
     return mock_source
@@ -41,8 +43,8 @@ def test_scrape_daily(
         mocker,
         log_output,
 ):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.return_value = False
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = set()
     mock_db_handler.insert_bulk_articles.return_value = (["test_id"], [])
     mocker.patch("globe_news_scraper.MongoHandler", return_value=mock_db_handler)
     mocker.patch(
@@ -50,8 +52,8 @@ def test_scrape_daily(
         return_value=[mock_news_source],
     )
     mocker.patch(
-        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content",
-        return_value=sample_news_article_html,
+        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content_with_status",
+        return_value=(200, sample_news_article_html),
     )
 
     scraper = GlobeNewsScraper(mock_config)
@@ -77,7 +79,7 @@ def test_scrape_daily(
             "log_level": "info",
         },
         {
-            "news_source": "Mock",
+            "news_source": "NewsSource",
             "country_code": "en-GB",
             "articles_count": 1,
             "event": "Country processing complete",
@@ -90,8 +92,8 @@ def test_scrape_daily(
 def test_scrape_daily_error_handling(
         mock_config, mock_telemetry, mock_news_source, mocker, log_output
 ):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.return_value = False
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = set()
     mock_db_handler.insert_bulk_articles.side_effect = Exception("Database error")
     mocker.patch("globe_news_scraper.MongoHandler", return_value=mock_db_handler)
 
@@ -100,8 +102,8 @@ def test_scrape_daily_error_handling(
         return_value=[mock_news_source],
     )
     mocker.patch(
-        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content",
-        return_value="<html><body>Test content</body></html>",
+        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content_with_status",
+        return_value=(200, "<html><body>Test content</body></html>"),
     )
 
     scraper = GlobeNewsScraper(mock_config)
@@ -126,7 +128,7 @@ def test_scrape_daily_error_handling(
             "log_level": "info",
         },
         {
-            "news_source": "Mock",
+            "news_source": "NewsSource",
             "country_code": "en-GB",
             "articles_count": 0,
             "event": "Country processing complete",
@@ -186,8 +188,8 @@ def test_scrape_daily_partial_success(
         mocker,
         log_output,
 ):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.side_effect = [False, True, False]
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = {"https://example.com/test2"}
     mock_db_handler.insert_bulk_articles.return_value = (["test_id_1"], [])
     mocker.patch("globe_news_scraper.MongoHandler", return_value=mock_db_handler)
     mocker.patch(
@@ -197,12 +199,13 @@ def test_scrape_daily_partial_success(
 
     def mock_fetch_content(url):
         if url == "https://example.com/test1":
-            return sample_news_article_html
+            return 200, sample_news_article_html
         elif url == "https://example.com/test3":
-            return sample_short_article_html
+            return 200, sample_short_article_html
+        return 404, None
 
     mocker.patch(
-        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content",
+        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.WebContentFetcher.fetch_content_with_status",
         side_effect=mock_fetch_content,
     )
 
@@ -212,7 +215,7 @@ def test_scrape_daily_partial_success(
     assert len(result) == 1
     assert "test_id_1" == result[0]
     assert mock_news_source.get_country_trending_news.call_count == 1
-    assert mock_db_handler.does_article_exist.call_count == 3
+    assert mock_db_handler.get_existing_urls.call_count == 1
     assert mock_db_handler.insert_bulk_articles.call_count == 1
     assert {
                "event": "Article already exists in the database, skipping: "
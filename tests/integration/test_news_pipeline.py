@@ -1,15 +1,18 @@
-from datetime import datetime
+from datetime import datetime, timezone
 
 import pytest
 
 from globe_news_scraper.data_providers.news_pipeline import NewsPipeline
+from globe_news_scraper.data_providers.news_pipeline.article_builder import ArticleBuilder
+from globe_news_scraper.data_providers.news_sources.base import NewsSource
 from globe_news_scraper.data_providers.news_sources.models import NewsSourceArticleData
+from globe_news_scraper.database import MongoHandler
 from globe_news_scraper.models import GlobeArticle
 
 
 @pytest.fixture
 def mock_news_source(mocker):
-    mock_source = mocker.Mock()
+    mock_source = mocker.Mock(spec=NewsSource)
     mock_source.get_country_trending_news.return_value = [
         NewsSourceArticleData(
             title="Test Article",
@@ -28,7 +31,7 @@ def mock_news_source(mocker):
 
 @pytest.fixture
 def mock_article_builder(mocker):
-    mock_builder = mocker.Mock()
+    mock_builder = mocker.Mock(spec=ArticleBuilder)
     mock_builder.build.return_value = GlobeArticle(
         title="Test Article",
         url="https://example.com/test",
@@ -45,8 +48,8 @@ def mock_article_builder(mocker):
 
 @pytest.mark.integration
 def test_run_pipeline(mock_config, mock_telemetry, mock_news_source, mock_article_builder, mocker, log_output):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.return_value = False
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = set()
     mock_db_handler.insert_bulk_articles.return_value = (["test_id"], [])
 
     mocker.patch('globe_news_scraper.data_providers.news_pipeline.NewsSourceFactory.get_all_sources',
@@ -58,6 +61,8 @@ def test_run_pipeline(mock_config, mock_telemetry, mock_news_source, mock_articl
 
     assert len(result) == 1
     assert result[0] == "test_id"
+    mock_db_handler.refresh_daily_summary.assert_called_once_with(
+        mock_article_builder.build.return_value.date_published.replace(tzinfo=timezone.utc))
     mock_news_source.get_country_trending_news.assert_called_once_with(mkt="DE")
     mock_article_builder.build.assert_called_once()
     mock_db_handler.insert_bulk_articles.assert_called_once()
@@ -75,8 +80,8 @@ def test_run_pipeline(mock_config, mock_telemetry, mock_news_source, mock_articl
 @pytest.mark.integration
 def test_run_pipeline_existing_article(mock_config, mock_telemetry, mock_news_source, mock_article_builder, mocker,
                                        log_output):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.return_value = True
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = {"https://example.com/test"}
 
     mocker.patch('globe_news_scraper.data_providers.news_pipeline.NewsSourceFactory.get_all_sources',
                  return_value=[mock_news_source])
@@ -89,6 +94,7 @@ def test_run_pipeline_existing_article(mock_config, mock_telemetry, mock_news_so
     mock_news_source.get_country_trending_news.assert_called_once_with(mkt="DE")
     mock_article_builder.build.assert_not_called()
     mock_db_handler.insert_bulk_articles.assert_not_called()
+    mock_db_handler.refresh_daily_summary.assert_not_called()
     assert {'articles_built': 0,
             'articles_inserted': 0,
             'build_success_rate': '0.00%',
@@ -103,8 +109,8 @@ def test_run_pipeline_existing_article(mock_config, mock_telemetry, mock_news_so
 @pytest.mark.integration
 def test_run_pipeline_error_handling(mock_config, mock_telemetry, mock_news_source, mock_article_builder, mocker,
                                      log_output):
-    mock_db_handler = mocker.Mock()
-    mock_db_handler.does_article_exist.return_value = False
+    mock_db_handler = mocker.Mock(spec=MongoHandler)
+    mock_db_handler.get_existing_urls.return_value = set()
     mock_db_handler.insert_bulk_articles.side_effect = Exception("Database error")
 
     mocker.patch('globe_news_scraper.data_providers.news_pipeline.NewsSourceFactory.get_all_sources',
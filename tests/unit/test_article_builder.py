@@ -29,7 +29,7 @@ def test_build_article(mock_config, mock_telemetry, log_output):
     # Mock the fetch_article_content and extract_article_data methods
     builder._fetch_article_content = (
         lambda
-            url: "<html><body>This is a test content for the article, and it's made longer to satisfy the character limit requirement. The purpose is to extend the content to more than 100 characters for testing.</body></html>"
+            url: (200, "<html><body>This is a test content for the article, and it's made longer to satisfy the character limit requirement. The purpose is to extend the content to more than 100 characters for testing.</body></html>")
     )
 
     builder._extract_article_data = lambda raw_html: ArticleData(
@@ -69,7 +69,7 @@ def test_build_article_content_too_short(mock_config, mock_telemetry, log_output
     )
 
     # Mock successful content fetching and extraction
-    builder._fetch_article_content = lambda url: "<html><body>Test content</body></html>"
+    builder._fetch_article_content = lambda url: (200, "<html><body>Test content</body></html>")
     builder._extract_article_data = lambda raw_html: ArticleData(
         cleaned_text="Test content",
         meta_lang="en",
@@ -103,7 +103,7 @@ def test_build_article_no_content(mock_config, mock_telemetry, log_output):
     )
 
     # Mock a failure in fetching content
-    builder._fetch_article_content = lambda url: None
+    builder._fetch_article_content = lambda url: (404, None)
 
     article = builder.build(news_item)
 
@@ -112,3 +112,73 @@ def test_build_article_no_content(mock_config, mock_telemetry, log_output):
                'event': 'No content to build GlobeArticle object with for https://example.com/test',
                'log_level': 'debug'
            } in log_output.entries
+
+
+@pytest.mark.unit
+def test_build_article_skips_debug_logs_when_disabled(mock_config, mock_telemetry, log_output, mocker):
+    mocker.patch('globe_news_scraper.data_providers.news_pipeline.article_builder.is_enabled_for', return_value=False)
+    builder = ArticleBuilder(mock_config, mock_telemetry)
+    builder._fetch_article_content = lambda url: (404, None)
+
+    news_item = NewsSourceArticleData(title="Test Article", url="https://example.com/test",
+                                      description="This is a test article", date_published=datetime.now(),
+                                      provider="Test Provider", origin_country="DE", language="de",
+                                      source_api="TestAPI")
+
+    assert builder.build(news_item) is None
+    assert log_output.entries == []
+
+
+@pytest.mark.unit
+def test_build_article_skips_failing_host(mock_config, mock_telemetry, mocker):
+    builder = ArticleBuilder(mock_config.model_copy(update={'HOST_FAILURE_THRESHOLD': 2}), mock_telemetry)
+    fetch = mocker.patch.object(builder, '_fetch_article_content', return_value=(503, None))
+
+    def news_item(url):
+        return NewsSourceArticleData(title="Test Article", url=url, description="This is a test article",
+                                     date_published=datetime.now(), provider="Test Provider", origin_country="DE",
+                                     language="de", source_api="TestAPI")
+
+    for i in range(3):
+        assert builder.build(news_item(f"https://failing.example.com/{i}")) is None
+    assert builder.build(news_item("https://example.com/other")) is None
+
+    # The third article of the failing host is skipped without fetching, other hosts are still fetched
+    assert [call.args[0] for call in fetch.call_args_list] == [
+        "https://failing.example.com/0", "https://failing.example.com/1", "https://example.com/other"]
+
+    # Once the cooldown is over the host is fetched again
+    mocker.patch('globe_news_scraper.data_providers.news_pipeline.article_builder.time.monotonic',
+                 return_value=float('inf'))
+    builder.build(news_item("https://failing.example.com/3"))
+    assert fetch.call_args.args[0] == "https://failing.example.com/3"
+
+
+@pytest.mark.unit
+def test_build_article_keeps_host_with_missing_pages(mock_config, mock_telemetry, mocker):
+    builder = ArticleBuilder(mock_config.model_copy(update={'HOST_FAILURE_THRESHOLD': 2}), mock_telemetry)
+    fetch = mocker.patch.object(builder, '_fetch_article_content', side_effect=[(408, None), (404, None),
+                                                                                (408, None), (415, None),
+                                                                                (404, None), (404, None)])
+
+    for i in range(6):
+        builder.build(NewsSourceArticleData(title="Test Article", url=f"https://example.com/{i}",
+                                            description="This is a test article", date_published=datetime.now(),
+                                            provider="Test Provider", origin_country="DE", language="de",
+                                            source_api="TestAPI"))
+
+    # Pages that are missing or aren't HTML neither count as failures of the host nor let timeouts add up
+    assert fetch.call_count == 6
+
+
+@pytest.mark.slow
+def test_extract_article_data_in_process_pool(mock_config, mock_telemetry, sample_news_article_html):
+    builder = ArticleBuilder(mock_config.model_copy(update={'MAX_EXTRACTION_WORKERS': 1}), mock_telemetry)
+
+    try:
+        article_data = builder._extract_article_data(sample_news_article_html)
+    finally:
+        builder.close()
+
+    assert article_data.cleaned_text.startswith("In a groundbreaking development")
+    assert builder._extraction_pool is None
@@ -0,0 +1,101 @@
+# path: tests/unit/test_browser_worker.py
+
+import threading
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+
+from globe_news_scraper.data_providers.news_pipeline.browser_worker import (
+    BrowserPool, BrowserWorker, _block_static_resources,
+)
+
+
+@pytest.fixture
+def mock_playwright(mocker):
+    mock_playwright = mocker.MagicMock()
+    browser = mock_playwright.firefox.launch.return_value
+    browser.is_connected.return_value = True
+    page = browser.new_context.return_value.new_page.return_value
+    page.goto.return_value.status = 200
+    page.content.return_value = '<html>content</html>'
+    sync_playwright = mocker.patch(
+        "globe_news_scraper.data_providers.news_pipeline.browser_worker.sync_playwright")
+    sync_playwright.return_value.start.return_value = mock_playwright
+    return mock_playwright
+
+
+@pytest.fixture
+def browser_worker(mock_playwright):
+    worker = BrowserWorker()
+    yield worker
+    worker.close()
+
+
+@pytest.mark.unit
+def test_browser_is_launched_once(browser_worker, mock_playwright):
+    assert browser_worker.fetch('https://example.com/first', {}) == (200, '<html>content</html>')
+    assert browser_worker.fetch('https://example.com/second', {}) == (200, '<html>content</html>')
+
+    browser = mock_playwright.firefox.launch.return_value
+    mock_playwright.firefox.launch.assert_called_once()
+    assert browser.new_context.call_count == 2
+    assert browser.new_context.return_value.close.call_count == 2
+
+
+@pytest.mark.unit
+def test_fetch_returns_error_status(browser_worker, mock_playwright):
+    page = mock_playwright.firefox.launch.return_value.new_context.return_value.new_page.return_value
+    page.goto.return_value.status = 403
+
+    assert browser_worker.fetch('https://example.com', {}) == (403, '')
+
+
+@pytest.mark.unit
+def test_disconnected_browser_is_relaunched(browser_worker, mock_playwright):
+    browser_worker.fetch('https://example.com', {})
+    mock_playwright.firefox.launch.return_value.is_connected.return_value = False
+    browser_worker.fetch('https://example.com', {})
+
+    assert mock_playwright.firefox.launch.call_count == 2
+
+
+@pytest.mark.unit
+def test_close_stops_playwright(mock_playwright):
+    worker = BrowserWorker()
+    worker.fetch('https://example.com', {})
+    worker.close()
+
+    mock_playwright.firefox.launch.return_value.close.assert_called_once()
+    mock_playwright.stop.assert_called_once()
+
+
+@pytest.mark.unit
+def test_pool_only_launches_browsers_for_overlapping_fetches(mock_playwright):
+    pool = BrowserPool(2)
+    try:
+        pool.fetch('https://example.com/first', {})
+        pool.fetch('https://example.com/second', {})
+        assert mock_playwright.firefox.launch.call_count == 1
+
+        # Both actions wait for each other, which only finishes if they run on different browsers
+        barrier = threading.Barrier(2, timeout=5)
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            results = list(executor.map(lambda _: pool.run(lambda context: barrier.wait()), range(2)))
+        assert sorted(results) == [0, 1]
+        assert mock_playwright.firefox.launch.call_count == 2
+    finally:
+        pool.close()
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('resource_type, aborted', [
+    ('document', False), ('script', False), ('xhr', False), ('image', True), ('font', True), ('stylesheet', True),
+])
+def test_static_resources_are_blocked(mocker, resource_type, aborted):
+    route = mocker.Mock()
+    route.request.resource_type = resource_type
+
+    _block_static_resources(route)
+
+    assert route.abort.called == aborted
+    assert route.continue_.called != aborted
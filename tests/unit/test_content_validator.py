@@ -54,3 +54,23 @@ def test_sanitize_content(mock_config):
     assert "$mongoOperator" not in sanitized_content
     assert "\u200B" not in sanitized_content
     assert "Unsafe content with" in sanitized_content
+
+
+@pytest.mark.unit
+def test_sanitize_strips_markup(mock_config):
+    validator = ContentValidator(mock_config)
+
+    content = "<p>Visible <b>text</b></p><style>p {}</style><iframe>frame</iframe> 3 < 4<script>alert(1)</script>"
+    sanitized_content = validator.sanitize(content)
+
+    assert sanitized_content == "Visible text 3 &lt; 4"
+
+
+@pytest.mark.unit
+def test_sanitize_keeps_text_after_unterminated_tags(mock_config):
+    validator = ContentValidator(mock_config)
+
+    content = "The <script> tag runs JS &amp; the <style> tag holds CSS. An <iframe> embeds <b>other</b> pages."
+    sanitized_content = validator.sanitize(content)
+
+    assert sanitized_content == "The  tag runs JS &amp; the  tag holds CSS. An  embeds other pages."
@@ -0,0 +1,97 @@
+# path: tests/unit/test_logger.py
+
+import logging
+
+import pytest
+
+from globe_news_scraper import logger as logger_module
+from globe_news_scraper.logger import BufferedRotatingFileHandler, GooseWarningFilter, configure_logging
+
+
+@pytest.fixture
+def buffered_handler(tmp_path):
+    handler = BufferedRotatingFileHandler(str(tmp_path / 'test.log'), maxBytes=1024, backupCount=2)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    yield handler
+    handler.close()
+
+
+def make_record(msg, level=logging.INFO):
+    return logging.LogRecord('test', level, __file__, 1, msg, None, None)
+
+
+@pytest.mark.unit
+def test_info_records_are_buffered(buffered_handler, tmp_path):
+    buffered_handler.handle(make_record('buffered message'))
+
+    assert (tmp_path / 'test.log').read_text() == ''
+
+
+@pytest.mark.unit
+def test_warning_records_flush_the_buffer(buffered_handler, tmp_path):
+    buffered_handler.handle(make_record('buffered message'))
+    buffered_handler.handle(make_record('warning message', logging.WARNING))
+
+    assert (tmp_path / 'test.log').read_text() == 'buffered message\nwarning message\n'
+
+
+@pytest.mark.unit
+def test_close_flushes_the_buffer(buffered_handler, tmp_path):
+    buffered_handler.handle(make_record('buffered message'))
+    buffered_handler.close()
+
+    assert (tmp_path / 'test.log').read_text() == 'buffered message\n'
+
+
+@pytest.mark.unit
+def test_rollover_keeps_buffered_records(buffered_handler, tmp_path):
+    for i in range(20):
+        buffered_handler.handle(make_record(f'{i:02d}' * 50))
+    buffered_handler.close()
+
+    assert (tmp_path / 'test.log.1').read_text() == ''.join(f'{i:02d}' * 50 + '\n' for i in range(10))
+    assert (tmp_path / 'test.log').read_text() == ''.join(f'{i:02d}' * 50 + '\n' for i in range(10, 20))
+
+
+@pytest.mark.unit
+def test_records_are_formatted_once(buffered_handler, mocker):
+    format_spy = mocker.spy(buffered_handler.formatter, 'format')
+    buffered_handler.handle(make_record('formatted once'))
+
+    assert format_spy.call_count == 1
+
+
+@pytest.mark.unit
+def test_goose_warning_filter():
+    goose_filter = GooseWarningFilter()
+    publish_date_record = logging.LogRecord('goose3.crawler', logging.WARNING, __file__, 1,
+                                            'Publish date %s could not be resolved to UTC', ('1718000000',), None)
+
+    assert not goose_filter.filter(publish_date_record)
+    assert goose_filter.filter(make_record('Publish date is missing', logging.WARNING))
+    assert goose_filter.filter(make_record('Some other warning', logging.WARNING))
+
+
+@pytest.mark.unit
+def test_configure_logging_replaces_its_handlers(tmp_path, monkeypatch):
+    root_logger = logging.getLogger()
+    monkeypatch.setattr(root_logger, 'handlers', list(root_logger.handlers))
+    monkeypatch.setattr(root_logger, 'level', root_logger.level)
+    monkeypatch.setattr(logger_module, '_configured_args', None)
+    monkeypatch.setattr(logger_module, '_installed_handlers', [])
+    monkeypatch.setattr(logger_module, '_logging_generation', 0)
+    handlers_before = len(root_logger.handlers)
+
+    try:
+        configure_logging('INFO', str(tmp_path), 'test')
+        installed = list(logger_module._installed_handlers)
+        configure_logging('INFO', str(tmp_path), 'test')
+        assert logger_module._installed_handlers == installed
+
+        configure_logging('DEBUG', str(tmp_path), 'test')
+        assert len(root_logger.handlers) == handlers_before + 2
+        assert not any(handler in root_logger.handlers for handler in installed)
+        assert len([f for f in logging.getLogger('goose3.crawler').filters if isinstance(f, GooseWarningFilter)]) == 1
+    finally:
+        for handler in logger_module._installed_handlers:
+            handler.close()
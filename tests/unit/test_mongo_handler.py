@@ -1,8 +1,10 @@
 from datetime import datetime, timezone
 
 import pytest
+from pymongo import DESCENDING
 from pymongo.errors import PyMongoError, OperationFailure, ExecutionTimeout, BulkWriteError
 
+from globe_news_scraper.database import mongo_handler as mongo_handler_module
 from globe_news_scraper.database.mongo_handler import MongoHandler, MongoHandlerError
 from globe_news_scraper.models import GlobeArticle
 
@@ -39,14 +41,79 @@ def test_init_success(mongo_handler, mock_mongo_client):
     assert "articles" in mongo_handler._db.list_collection_names()
 
 
+@pytest.mark.unit
+def test_client_is_shared_per_uri(mock_config, mocker, monkeypatch):
+    mongo_client = mocker.patch.object(mongo_handler_module, 'MongoClient')
+    monkeypatch.setattr(mongo_handler_module, '_clients', {})
+
+    first = mongo_handler_module._get_client(mock_config)
+    assert mongo_handler_module._get_client(mock_config.model_copy()) is first
+    mongo_handler_module._get_client(mock_config.model_copy(update={'MONGO_URI': 'mongodb://other:27017'}))
+
+    assert mongo_client.call_count == 2
+    mongo_client.assert_any_call('mongodb://localhost:27017', maxPoolSize=10, minPoolSize=1,
+                                 serverSelectionTimeoutMS=5000)
+
+
 @pytest.mark.unit
 def test_initialize_database(mongo_handler):
     mongo_handler.initialize_database()
-    # Check if indexes are created
-    assert mongo_handler._articles.create_index.call_count == 7  # +1 call in _check_permissions
+    # Check if indexes are created in a single command
+    assert mongo_handler._articles.create_indexes.call_count == 1
+    assert len(mongo_handler._articles.create_indexes.call_args.args[0]) == 8
     assert (
-            mongo_handler._db.command.call_count == 4
-    )  # Two view creations and one schema validation +1 call in _check_permissions
+            mongo_handler._db.command.call_count == 3
+    )  # One view creation and two schema validations
+    # The daily summary is indexed by date and backfilled over every day
+    mongo_handler._db.daily_article_summary_by_country.create_index.assert_called_once_with(
+        [("date", DESCENDING)], unique=True, name="date_-1")
+    pipeline = mongo_handler._articles.aggregate.call_args.args[0]
+    assert '$match' not in pipeline[0]
+    assert pipeline[-1]['$merge']['into'] == 'daily_article_summary_by_country'
+
+
+@pytest.mark.unit
+def test_initialize_database_skips_existing_indexes(mongo_handler):
+    mongo_handler._articles.index_information.return_value = {
+        "_id_": {"key": [("_id", 1)]},
+        "url_1": {"key": [("url", 1)], "unique": True},
+        "title_1": {"key": [("title", 1)], "unique": True},
+        "date_published_-1": {"key": [("date_published", -1)]},
+        "date_published_1_origin_country_1": {"key": [("date_published", 1), ("origin_country", 1)]},
+        "category_1": {"key": [("category", 1)]},
+        "origin_country_1": {"key": [("origin_country", 1)]},
+        # Changed definition, must be rebuilt
+        "post_processed_1_date_scraped_-1": {"key": [("post_processed", 1)]},
+        "post_processed_partial_idx": {"key": [("date_scraped", -1)], "partialFilterExpression": {"post_processed": True}},
+    }
+    mongo_handler.initialize_database()
+
+    mongo_handler._articles.drop_index.assert_any_call("post_processed_1_date_scraped_-1")
+    rebuilt = mongo_handler._articles.create_indexes.call_args.args[0]
+    assert [index.document["name"] for index in rebuilt] == ["post_processed_1_date_scraped_-1"]
+
+
+@pytest.mark.unit
+def test_initialize_database_updates_existing_views(mongo_handler):
+    mongo_handler._db.list_collections.return_value = [
+        {'name': 'articles', 'type': 'collection'},
+        {'name': 'filtered_articles', 'type': 'view'},
+        {'name': 'daily_article_summary_by_country', 'type': 'view'},
+    ]
+    mongo_handler.initialize_database()
+
+    commands = [call.args[0] for call in mongo_handler._db.command.call_args_list]
+    assert {'collMod': 'filtered_articles'}.items() <= commands[0].items()
+    assert 'create' not in commands[0]
+    mongo_handler._db.drop_collection.assert_called_once_with('daily_article_summary_by_country')
+
+
+@pytest.mark.unit
+def test_refresh_daily_summary_since(mongo_handler):
+    mongo_handler.refresh_daily_summary(datetime(2024, 6, 10, 15, 30, tzinfo=timezone.utc))
+
+    pipeline = mongo_handler._articles.aggregate.call_args.args[0]
+    assert pipeline[0] == {'$match': {'date_published': {'$gte': datetime(2024, 6, 10, tzinfo=timezone.utc)}}}
 
 
 @pytest.mark.unit
@@ -156,3 +223,34 @@ def test_insert_bulk_write_error(mongo_handler, mocker):
     # Check that the error is correctly recorded
     assert len(errors) == 1
     assert errors[0]['error'] == 'Duplicate key'
+
+
+@pytest.mark.unit
+def test_get_existing_urls(mongo_handler):
+    mongo_handler._articles.find.return_value = [{"url": "https://example.com/2"}]
+    urls = ["https://example.com/1", "https://example.com/2"]
+
+    assert mongo_handler.get_existing_urls(urls) == {"https://example.com/2"}
+    mongo_handler._articles.find.assert_called_once_with({"url": {"$in": urls}}, {"url": 1, "_id": 0})
+    assert mongo_handler.get_existing_urls([]) == set()
+    assert mongo_handler._articles.find.call_count == 1
+
+
+@pytest.mark.unit
+def test_insert_bulk_articles_is_unordered(mongo_handler, mocker):
+    def insert_many(documents, ordered):
+        for i, document in enumerate(documents):
+            document['_id'] = f"id{i}"
+        raise BulkWriteError({'writeErrors': [{'index': 0, 'errmsg': 'Duplicate key'}]})
+
+    insert_many_mock = mocker.patch.object(mongo_handler._articles, 'insert_many', side_effect=insert_many)
+    articles = [GlobeArticle(title=f"Test {i}", url=f"https://example.com/{i}", description="Test",
+                             date_published=datetime.now(timezone.utc), provider="Test", language="en",
+                             content="Test", origin_country="US", source_api="Test") for i in range(3)]
+
+    inserted_ids, errors = mongo_handler.insert_bulk_articles(articles)
+
+    assert insert_many_mock.call_args.kwargs['ordered'] is False
+    # The documents after the duplicate are still inserted
+    assert inserted_ids == ["id1", "id2"]
+    assert [error['url'] for error in errors] == ["https://example.com/0"]
@@ -3,7 +3,7 @@
 import pytest
 from playwright.sync_api import TimeoutError, Error as PlaywrightError
 
-from globe_news_scraper.data_providers.news_pipeline.web_content_fetcher import WebContentFetcher
+from globe_news_scraper.data_providers.news_pipeline.web_content_fetcher import WebContentFetcher, _normalize_url
 from globe_news_scraper.monitoring.request_tracker import RequestTracker
 
 
@@ -22,6 +22,16 @@ def test_fetch_content_custom_domain_success(web_content_fetcher, mocker):
     assert web_content_fetcher._request_tracker.get_all_requests()['custom_example.com_request'][200] == 1
 
 
+@pytest.mark.unit
+def test_fetch_content_custom_domain_matches_subdomains(web_content_fetcher, mocker):
+    custom_fetcher = mocker.Mock(return_value=(200, 'Custom content'))
+    mocker.patch.dict(web_content_fetcher._domain_fetchers, {'example.com': custom_fetcher})
+
+    assert web_content_fetcher.fetch_content('https://News.Example.com:443/article') == 'Custom content'
+    assert web_content_fetcher._request_tracker.get_all_requests()['custom_example.com_request'][200] == 1
+    assert web_content_fetcher._find_fetcher_domain('example.org') is None
+
+
 @pytest.mark.unit
 def test_fetch_content_custom_domain_failure(web_content_fetcher, mocker):
     mocker.patch.dict(web_content_fetcher._domain_fetchers, {'example.com': mocker.Mock(return_value=(403, ''))})
@@ -32,10 +42,12 @@ def test_fetch_content_custom_domain_failure(web_content_fetcher, mocker):
 
 @pytest.mark.unit
 def test_fetch_content_basic_request_success(web_content_fetcher, mocker):
-    mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(200, 'Test content'))
+    mock_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(200, 'Test content'))
     content = web_content_fetcher.fetch_content('https://example.com')
+    _, kwargs = mock_fetch.call_args
     assert content == 'Test content'
-    assert web_content_fetcher._headers['User-Agent'] == 'RandomUserAgent'
+    assert kwargs['headers']['User-Agent'] == 'RandomUserAgent'
+    assert 'User-Agent' not in web_content_fetcher._headers
     assert web_content_fetcher._request_tracker.get_all_requests()['basic_request'][200] == 1
 
 
@@ -68,13 +80,101 @@ def test_fetch_content_all_methods_fail(web_content_fetcher, mocker):
     assert web_content_fetcher._request_tracker.get_all_requests()['all_methods_failed'][408] == 1
 
 
+@pytest.mark.unit
+def test_fetch_content_missing_page_skips_fallbacks(web_content_fetcher, mocker):
+    mock_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(404, ''))
+    mock_playwright_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_playwright')
+    content = web_content_fetcher.fetch_content('https://example.com')
+    assert content is None
+    assert mock_fetch.call_count == 1
+    mock_playwright_fetch.assert_not_called()
+    assert web_content_fetcher._request_tracker.get_all_requests()['basic_request'][404] == 1
+
+
+@pytest.mark.unit
+def test_fetch_content_server_error_skips_postman(web_content_fetcher, mocker):
+    mock_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(503, ''))
+    mocker.patch.object(web_content_fetcher, '_fetch_with_playwright', return_value=(200, 'Playwright content'))
+    content = web_content_fetcher.fetch_content('https://example.com')
+    assert content == 'Playwright content'
+    assert mock_fetch.call_count == 1
+
+
+@pytest.mark.unit
+def test_fetch_content_caches_pages(web_content_fetcher, mocker):
+    mock_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(200, 'Test content'))
+    assert web_content_fetcher.fetch_content('https://example.com/article?id=1&utm_source=feed') == 'Test content'
+    assert web_content_fetcher.fetch_content('https://EXAMPLE.com/article?id=1#comments') == 'Test content'
+    assert mock_fetch.call_count == 1
+    assert web_content_fetcher._request_tracker.get_all_requests()['cached_request'][200] == 1
+
+
+@pytest.mark.unit
+def test_fetch_content_caches_failures(web_content_fetcher, mocker):
+    mock_fetch = mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(404, ''))
+    assert web_content_fetcher.fetch_content('https://example.com/missing') is None
+    assert web_content_fetcher.fetch_content_with_status('https://example.com/missing') == (404, None)
+    assert mock_fetch.call_count == 1
+    assert 'cached_request' not in web_content_fetcher._request_tracker.get_all_requests()
+
+
+@pytest.mark.unit
+def test_normalize_url():
+    assert _normalize_url('HTTPS://Example.com/a/b?utm_medium=x&id=1&fbclid=abc#top') == 'https://example.com/a/b?id=1'
+    assert _normalize_url('https://example.com/a?q=') == 'https://example.com/a?q='
+
+
+@pytest.mark.unit
+def test_fetch_with_requests_reuses_session(web_content_fetcher, requests_mock):
+    requests_mock.get('https://example.com/first', text='<html>first</html>')
+    requests_mock.get('https://example.com/second', text='<html>second</html>')
+
+    assert web_content_fetcher._fetch_with_requests('https://example.com/first') == (200, '<html>first</html>')
+    assert web_content_fetcher._fetch_with_requests('https://example.com/second') == (200, '<html>second</html>')
+    assert requests_mock.call_count == 2
+
+
+@pytest.mark.unit
+def test_fetch_with_requests_caps_response_size(mock_config, requests_mock):
+    config = mock_config.model_copy(update={'MAX_RESPONSE_BYTES': 100})
+    web_content_fetcher = WebContentFetcher(config, RequestTracker())
+    requests_mock.get('https://example.com', content=b'<html>' + b'a' * 1000 + b'</html>')
+
+    status_code, content = web_content_fetcher._fetch_with_requests('https://example.com')
+
+    assert status_code == 200
+    assert content == '<html>' + 'a' * 94
+
+
+@pytest.mark.unit
+@pytest.mark.parametrize('content_type, body', [
+    ('text/html; charset=ISO-8859-1', '<html>Grüße</html>'.encode('latin-1')),
+    ('text/html', '<html><meta charset="windows-1252">Grüße</html>'.encode('cp1252')),
+    ('text/html', '<html>Grüße</html>'.encode('utf-8')),
+])
+def test_fetch_with_requests_decodes_declared_encoding(web_content_fetcher, requests_mock, content_type, body):
+    requests_mock.get('https://example.com', content=body, headers={'Content-Type': content_type})
+
+    status_code, content = web_content_fetcher._fetch_with_requests('https://example.com')
+
+    assert status_code == 200
+    assert 'Grüße' in content
+
+
+@pytest.mark.unit
+def test_fetch_with_requests_rejects_non_html(web_content_fetcher, requests_mock):
+    requests_mock.get('https://example.com/file.pdf', content=b'%PDF-1.4', headers={'Content-Type': 'application/pdf'})
+
+    assert web_content_fetcher._fetch_with_requests('https://example.com/file.pdf') == (415, '')
+
+
 @pytest.mark.unit
 def test_logging_on_playwright_attempt(web_content_fetcher, mocker, log_output):
     mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(403, None))
     mocker.patch.object(web_content_fetcher, '_fetch_with_playwright', return_value=(200, 'Playwright content'))
     web_content_fetcher.fetch_content('https://example.com')
-    assert {'event': 'Failed to fetch https://example.com with "requests" library. Trying Playwright.',
-            'log_level': 'debug'} in log_output.entries
+    assert {'event': 'Failed to fetch with "requests" library, trying Playwright', 'url': 'https://example.com',
+            'status_code': 403, 'log_level': 'debug'} in log_output.entries
 
 
 @pytest.mark.unit
@@ -82,20 +182,17 @@ def test_logging_on_all_methods_fail(web_content_fetcher, mocker, log_output):
     mocker.patch.object(web_content_fetcher, '_fetch_with_requests', return_value=(403, None))
     mocker.patch.object(web_content_fetcher, '_fetch_with_playwright', return_value=(408, None))
     web_content_fetcher.fetch_content('https://example.com')
-    assert {'event': 'All methods failed to load page: https://example.com', 'log_level': 'debug'} in log_output.entries
+    assert {'event': 'All methods failed to load page', 'url': 'https://example.com', 'status_code': 408,
+            'log_level': 'debug'} in log_output.entries
 
 
 @pytest.fixture
 def mock_playwright(mocker):
     mock_playwright = mocker.MagicMock()
-    mock_playwright.__enter__.return_value = mock_playwright
-    mock_playwright.firefox.launch.return_value = mocker.MagicMock()
-    mock_playwright.firefox.launch.return_value.new_context.return_value = mocker.MagicMock()
-    mock_playwright.firefox.launch.return_value.new_context.return_value.new_page.return_value = mocker.MagicMock()
-    mocker.patch(
-        "globe_news_scraper.data_providers.news_pipeline.web_content_fetcher.sync_playwright",
-        return_value=mock_playwright,
-    )
+    mock_playwright.firefox.launch.return_value.is_connected.return_value = True
+    sync_playwright = mocker.patch(
+        "globe_news_scraper.data_providers.news_pipeline.browser_worker.sync_playwright")
+    sync_playwright.return_value.start.return_value = mock_playwright
     return mock_playwright
 
 
@@ -116,7 +213,24 @@ def test_fetch_msn_com(web_content_fetcher, mock_playwright):
 
     page.goto.assert_called_once_with("https://www.msn.com/article", timeout=10000)
     mock_playwright.firefox.launch.return_value.new_context.return_value.close.assert_called()
-    mock_playwright.firefox.launch.return_value.close.assert_called()
+    mock_playwright.firefox.launch.return_value.close.assert_not_called()
+
+
+@pytest.mark.unit
+def test_fetch_msn_com_reuses_browser(web_content_fetcher, mock_playwright):
+    page = setup_msn_test(mock_playwright)
+    page.goto.side_effect = TimeoutError("Timeout occurred")
+
+    web_content_fetcher._fetch_msn_com("https://www.msn.com/first")
+    web_content_fetcher._fetch_msn_com("https://www.msn.com/second")
+
+    browser = mock_playwright.firefox.launch.return_value
+    mock_playwright.firefox.launch.assert_called_once()
+    assert browser.new_context.return_value.close.call_count == 2
+    browser.close.assert_not_called()
+
+    web_content_fetcher.close()
+    browser.close.assert_called_once()
 
 
 @pytest.mark.unit
@@ -129,7 +243,8 @@ def test_fetch_msn_com_timeout(web_content_fetcher, mock_playwright, log_output)
     assert status_code == 408
     assert content == ""
     assert log_output.entries[0] == {
-        "event": "Failed to fetch article from MSN: Timeout exceeded for https://www.msn.com/article",
+        "event": "Failed to fetch article from MSN: Timeout exceeded",
+        "url": "https://www.msn.com/article",
         "log_level": "warning",
     }
 
@@ -144,7 +259,8 @@ def test_fetch_msn_com_error(web_content_fetcher, mock_playwright, log_output):
     assert status_code == 500
     assert content == ""
     assert log_output.entries[0] == {
-        "event": "MSN - Failed to fetch article content for "
-                 "https://www.msn.com/article: Unexpected Playwright error",
+        "event": "MSN - Failed to fetch article content",
+        "url": "https://www.msn.com/article",
+        "error": "Unexpected Playwright error",
         "log_level": "warning",
     }